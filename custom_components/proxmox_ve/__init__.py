@@ -1,7 +1,10 @@
 """The Proxmox VE integration."""
 import asyncio
+import fnmatch
 import logging
+import re
 from datetime import timedelta
+from typing import Optional
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -9,7 +12,16 @@ from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import ProxmoxAPI
-from .const import DOMAIN, PLATFORMS, UPDATE_INTERVAL
+from .const import (
+    CONF_VM_FILTER,
+    DEFAULT_VM_FILTER,
+    DOMAIN,
+    NODE_UPDATE_INTERVAL,
+    PLATFORMS,
+    STATUS_RUNNING,
+    STORAGE_UPDATE_INTERVAL,
+    UPDATE_INTERVAL,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,29 +45,71 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         await hass.async_add_executor_job(api.test_connection)
     except Exception as e:
         _LOGGER.error("Failed to connect to Proxmox VE server: %s", e)
+        await hass.async_add_executor_job(api.close)
         raise ConfigEntryNotReady from e
     
-    # Create update coordinator
-    coordinator = DataUpdateCoordinator(
+    vm_filter = _compile_vm_filter(
+        entry.options.get(CONF_VM_FILTER, DEFAULT_VM_FILTER)
+    )
+    
+    # VMs, nodes and storages each get their own coordinator, so a refresh
+    # of one only wakes the entities that read it
+    vm_coordinator = _create_coordinator(
         hass,
-        _LOGGER,
-        name=f"Proxmox VE {entry.data['host']}",
-        update_method=lambda: _async_update_data(hass, api),
-        update_interval=timedelta(seconds=UPDATE_INTERVAL),
+        entry,
+        "VMs",
+        lambda: _async_update_vms(
+            hass,
+            api,
+            vm_filter,
+            # After a failed refresh every entity needs a fresh state write
+            vm_coordinator.data if vm_coordinator.last_update_success else None,
+        ),
+        UPDATE_INTERVAL,
+    )
+    node_coordinator = _create_coordinator(
+        hass, entry, "nodes", lambda: _async_update_nodes(hass, api), NODE_UPDATE_INTERVAL
+    )
+    storage_coordinator = _create_coordinator(
+        hass,
+        entry,
+        "storages",
+        lambda: _async_update_storages(hass, api),
+        STORAGE_UPDATE_INTERVAL,
     )
     
-    # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
+    # Fetch VMs first so that the cluster listing is cached, then nodes and
+    # storages together; both are served from that listing
+    try:
+        await vm_coordinator.async_config_entry_first_refresh()
+        await asyncio.gather(
+            node_coordinator.async_config_entry_first_refresh(),
+            storage_coordinator.async_config_entry_first_refresh(),
+        )
+    except ConfigEntryNotReady:
+        # Setup is retried with a new client, release this one's session
+        await _async_close(
+            hass, api, (vm_coordinator, node_coordinator, storage_coordinator)
+        )
+        raise
     
-    # Store API client and coordinator
+    # Store API client and coordinators
     hass.data[DOMAIN][entry.entry_id] = {
         "api": api,
-        "coordinator": coordinator,
+        "vm_coordinator": vm_coordinator,
+        "node_coordinator": node_coordinator,
+        "storage_coordinator": storage_coordinator,
+        # Button unique id -> lock held while its action runs
+        "action_locks": {},
     }
     
     # Set up all platforms using the new async_forward_entry_setups method
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
+    # Entities are created from the filtered VM list, so apply new options
+    # by reloading the entry
+    entry.async_on_unload(entry.add_update_listener(_async_reload_entry))
+    
     return True
 
 
@@ -65,20 +119,119 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        data = hass.data[DOMAIN].pop(entry.entry_id)
+        await _async_close(
+            hass,
+            data["api"],
+            (
+                data["vm_coordinator"],
+                data["node_coordinator"],
+                data["storage_coordinator"],
+            ),
+        )
     
     return unload_ok
 
 
-async def _async_update_data(hass, api):
-    """Update data from Proxmox VE API."""
+async def _async_close(hass, api, coordinators):
+    """Stop the coordinators, then close the API client they use."""
+    # No refresh may be scheduled once the client's worker pool is gone
+    for coordinator in coordinators:
+        await coordinator.async_shutdown()
+    # Closing the session closes its sockets, keep that off the loop
+    await hass.async_add_executor_job(api.close)
+
+
+async def _async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+def _compile_vm_filter(vm_filter: str) -> Optional["re.Pattern[str]"]:
+    """Compile a comma-separated list of VM name/id wildcards into one pattern.
+
+    Returns None for an empty filter, meaning every VM is included.
+    """
+    wildcards = [wildcard.strip() for wildcard in vm_filter.split(",")]
+    wildcards = [wildcard for wildcard in wildcards if wildcard]
+    if not wildcards:
+        return None
+    return re.compile("|".join(fnmatch.translate(wildcard) for wildcard in wildcards))
+
+
+def _create_coordinator(hass, entry, kind, update_method, interval):
+    """Create the update coordinator for one kind of cluster resource."""
+    return DataUpdateCoordinator(
+        hass,
+        _LOGGER,
+        name=f"Proxmox VE {entry.data['host']} {kind}",
+        update_method=update_method,
+        update_interval=timedelta(seconds=interval),
+        # Don't wake every entity when nothing in the cluster changed
+        always_update=False,
+    )
+
+
+def _add_percent(usage):
+    """Store the used/total percentage on a usage dict, when it has both."""
+    total = usage.get("total", 0)
+    if "used" in usage and total > 0:
+        usage["percent"] = round(usage["used"] / total * 100, 2)
+
+
+async def _async_fetch(hass, fetch, *args):
+    """Run a blocking API getter in the executor."""
     try:
-        # Get all clusters, nodes, VMs, and storages
-        data = {}
-        data["nodes"] = await hass.async_add_executor_job(api.get_nodes)
-        data["vms"] = await hass.async_add_executor_job(api.get_vms)
-        data["storages"] = await hass.async_add_executor_job(api.get_storages)
-        return data
+        return await hass.async_add_executor_job(fetch, *args)
     except Exception as e:
         _LOGGER.error("Error updating Proxmox VE data: %s", e)
         raise UpdateFailed(f"Error communicating with API: {e}")
+
+
+async def _async_update_vms(hass, api, vm_filter=None, previous=None):
+    """Update VM data from Proxmox VE API.
+
+    ``vm_filter`` limits the VMs to those the user included. ``previous``
+    is the last successful result, used to work out which VMs changed so
+    that entities of unchanged VMs can skip their update.
+    """
+    vms = await _async_fetch(hass, api.get_vms, vm_filter)
+
+    # Derive the power state once here rather than in every entity, and
+    # index by id so entities can look up their own row directly
+    for vm in vms:
+        vm["is_running"] = vm["status"] == STATUS_RUNNING
+        vm["cpu"]["percent"] = round(vm["cpu"]["used"] * 100, 2)
+        _add_percent(vm["memory"])
+    vms_by_id = {vm["id"]: vm for vm in vms}
+    previous_vms = previous["vms_by_id"] if previous else {}
+    # Removed VMs count as changed so their entities go unavailable
+    changed_vms = {
+        vm_id for vm_id, vm in vms_by_id.items() if previous_vms.get(vm_id) != vm
+    } | (previous_vms.keys() - vms_by_id.keys())
+    return {"vms": vms, "vms_by_id": vms_by_id, "changed_vms": changed_vms}
+
+
+async def _async_update_nodes(hass, api):
+    """Update node data from Proxmox VE API."""
+    nodes = await _async_fetch(hass, api.get_nodes)
+    for node in nodes:
+        node["is_online"] = node["status"] == "online"
+        node["cpu_percent"] = round(node["cpu"] * 100, 2)
+        _add_percent(node["memory"])
+        _add_percent(node["disk"])
+    return {"nodes": nodes, "nodes_by_id": {node["id"]: node for node in nodes}}
+
+
+async def _async_update_storages(hass, api):
+    """Update storage data from Proxmox VE API."""
+    storages = await _async_fetch(hass, api.get_storages)
+    for storage in storages:
+        _add_percent(storage["disk"])
+    return {
+        "storages": storages,
+        # Storage ids repeat across nodes, so key them by (storage, node)
+        "storages_by_key": {
+            (storage["id"], storage["node"]): storage for storage in storages
+        },
+    }
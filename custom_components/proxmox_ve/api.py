@@ -1,13 +1,159 @@
 """API client for Proxmox VE."""
 import logging
-from typing import Dict, List, Optional
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple
 
+import orjson
 import proxmoxer
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectTimeout, SSLError
+from urllib3.util.retry import Retry
+
+from .const import STATUS_RUNNING, UPDATE_INTERVAL
 
 _LOGGER = logging.getLogger(__name__)
 
+# Connection pool sizing for the shared HTTP session
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 20
+
+# (connect, read) timeout for every API request; proxmoxer only applies
+# its own timeout to the login call
+REQUEST_TIMEOUT = (3, 5)  # seconds
+
+# Retry idempotent requests when the API proxy is briefly unavailable
+RETRY = Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+
+# Upper bound on concurrent per-node/per-guest requests during a refresh
+MAX_WORKERS = min(8, (os.cpu_count() or 2) * 2)
+
+# How long the vmid -> type map from the last refresh is trusted
+VM_TYPE_CACHE_TTL = UPDATE_INTERVAL * 2  # seconds
+
+# Response cache tiers: live status, cluster listings, slow-moving details
+CACHE_TTL_SHORT = 5  # seconds
+CACHE_TTL_NORMAL = 10  # seconds
+CACHE_TTL_LONG = 60  # seconds
+
+# Guest configs (cores, memory, disks) rarely change, keep them this long
+CONFIG_CACHE_TTL = 300  # seconds
+
+# How long an expired config or disk listing may still be served while the
+# API errors; live status is never served stale
+CACHE_MAX_STALE = 300  # seconds
+
+# Guest IP addresses come from the (slow) guest agent, re-read them this often
+IP_CACHE_TTL = UPDATE_INTERVAL * 5  # seconds
+
+# Don't ask a VM that reported no guest agent again for this long
+NO_AGENT_COOLDOWN = 300  # seconds
+
+# How long a force restarted guest may take to stop before starting it
+FORCE_RESTART_TIMEOUT = 10  # seconds
+
+# Config value parsing, e.g. "local-lvm:vm-100-disk-0,size=32G"
+_SIZE_RE = re.compile(r"size=(\d+(?:\.\d+)?)\s*([KMGTP]?)(?:i?B)?\b", re.IGNORECASE)
+_SHIFT = {"": 0, "K": 10, "M": 20, "G": 30, "T": 40, "P": 50}
+# Config keys holding disks (not e.g. "scsihw") and container mount points
+_QEMU_DISK_KEY_RE = re.compile(r"(?:ide|sata|scsi|virtio|nvme)\d+$")
+_LXC_MOUNT_KEY_RE = re.compile(r"(?:rootfs|mp\d+)$")
+# Static LXC address, e.g. "name=eth0,bridge=vmbr0,ip=192.168.1.10/24"
+_IP_RE = re.compile(r"\bip=(\d{1,3}(?:\.\d{1,3}){3})")
+# Error of an agent call on a VM whose guest agent is not enabled; unlike
+# "not running" (e.g. while booting) this does not go away by itself
+_NO_AGENT_RE = re.compile(r"no qemu guest agent configured", re.IGNORECASE)
+
+
+def _agent_not_configured(error: Exception) -> bool:
+    """Return true if an agent call failed because the VM has no agent."""
+    message = str(error)
+    response = getattr(error, "response", None)
+    if response is not None:
+        # Proxmox puts the reason in the status line and in the body
+        message = f"{message} {response.reason} {response.text}"
+    return _NO_AGENT_RE.search(message) is not None
+
+
+def _size_bytes(match: "re.Match[str]") -> int:
+    """Convert a _SIZE_RE match to bytes."""
+    number, shift = match.group(1), _SHIFT[match.group(2).upper()]
+    # Sizes are whole numbers almost always, keep those in integer math
+    if "." in number:
+        return int(float(number) * (1 << shift))
+    return int(number) << shift
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTP adapter that applies REQUEST_TIMEOUT unless a timeout is given."""
+
+    def send(self, request, timeout=None, **kwargs):
+        """Send the request with the default timeout."""
+        if timeout is None:
+            timeout = REQUEST_TIMEOUT
+        return super().send(request, timeout=timeout, **kwargs)
+
+
+class _ResponseCache:
+    """Per-key cache of API responses with expiry and stale fallback."""
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def get_or_fetch(
+        self,
+        key: Hashable,
+        ttl: float,
+        fetch: Callable[[], Any],
+        max_stale: float = CACHE_MAX_STALE,
+    ) -> Any:
+        """Return the cached value for key, calling fetch once it has expired.
+
+        If fetch fails and an entry expired less than max_stale seconds ago,
+        the old value is returned instead so that a short API outage does
+        not blank every sensor. Live status passes max_stale=0, so that an
+        outage makes the refresh fail rather than freeze running states.
+        """
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and now < entry[0]:
+            return entry[1]
+
+        try:
+            value = fetch()
+        except Exception as error:
+            if entry is None or now - entry[0] > max_stale:
+                raise
+            _LOGGER.warning("Using cached %s after API error: %s", key, error)
+            return entry[1]
+
+        self._entries[key] = (now + ttl, value)
+        return value
+
+    def discard(self, key: Hashable) -> None:
+        """Drop the cached response for key, if any."""
+        self._entries.pop(key, None)
+
+    def prune(self, kind: str, keep: Set[Tuple]) -> None:
+        """Drop the entries of one kind whose remaining key is not in keep.
+
+        Keys are tuples like ("config", node, vm_id); this removes e.g. the
+        configs of guests that were deleted, migrated or filtered out.
+        """
+        # Snapshot the keys, other refreshes may add entries meanwhile
+        for key in list(self._entries):
+            if isinstance(key, tuple) and key[0] == kind and key[1:] not in keep:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+
 
 class ProxmoxAPI:
     """API client for Proxmox VE."""
@@ -29,6 +175,23 @@ class ProxmoxAPI:
         self.realm = realm
         self.verify_ssl = verify_ssl
         self._proxmox = None
+        self._session: Optional[requests.Session] = None
+        self._base_url = ""
+        self._connect_lock = threading.Lock()
+        # Fan-out happens on our own small pool so a large cluster does not
+        # tie up more than one of Home Assistant's executor workers
+        self._pool = ThreadPoolExecutor(
+            max_workers=MAX_WORKERS, thread_name_prefix=f"proxmox-{host}"
+        )
+        self._vm_type_cache: Dict[int, str] = {}
+        self._vm_type_cache_time = 0.0
+        # vmid -> (monotonic fetch time, guest status, IPv4 address)
+        self._ip_cache: Dict[int, Tuple[float, str, Optional[str]]] = {}
+        # vmid -> monotonic time until which its guest agent is not queried
+        self._no_agent: Dict[int, float] = {}
+        # (node, vmid) -> (config digest, parsed cores/memory/disk)
+        self._config_totals: Dict[Tuple[str, int], Tuple[str, Tuple[int, int, int]]] = {}
+        self._cache = _ResponseCache()
         # Don't connect here, we'll connect on first use
         # to avoid blocking calls in the constructor
 
@@ -36,20 +199,68 @@ class ProxmoxAPI:
         """Connect to Proxmox API."""
         # This method should only be called from methods
         # that are executed in an executor
+        # proxmoxer renews the ticket itself, so log in only once
         if self._proxmox is not None:
             return
 
-        try:
-            self._proxmox = proxmoxer.ProxmoxAPI(
-                self.host,
-                port=self.port,
-                user=f"{self.user}@{self.realm}",
-                password=self.password,
-                verify_ssl=self.verify_ssl,
+        # Fan-out threads may all arrive here at once on startup; only the
+        # first one logs in
+        with self._connect_lock:
+            if self._proxmox is not None:
+                return
+
+            try:
+                proxmox = proxmoxer.ProxmoxAPI(
+                    self.host,
+                    port=self.port,
+                    user=f"{self.user}@{self.realm}",
+                    password=self.password,
+                    verify_ssl=self.verify_ssl,
+                    timeout=REQUEST_TIMEOUT,
+                )
+            except (ConnectTimeout, SSLError) as error:
+                _LOGGER.error("Error connecting to Proxmox VE: %s", error)
+                raise
+
+            # proxmoxer keeps a single requests session for all calls made
+            # through this client; give it a larger keep-alive pool so that
+            # every request in a refresh reuses an open TLS connection
+            session = proxmox._store["session"]
+            session.mount(
+                f"https://{self.host}:{self.port}/",
+                _TimeoutHTTPAdapter(
+                    pool_connections=POOL_CONNECTIONS,
+                    pool_maxsize=POOL_MAXSIZE,
+                    max_retries=RETRY,
+                ),
             )
-        except (ConnectTimeout, SSLError) as error:
-            _LOGGER.error("Error connecting to Proxmox VE: %s", error)
-            raise
+            session.headers["Connection"] = "keep-alive"
+            session.verify = self.verify_ssl
+
+            self._session = session
+            self._base_url = proxmox._store["base_url"]
+            self._proxmox = proxmox
+
+    def close(self) -> None:
+        """Close the HTTP session and shut down the worker pool."""
+        self._pool.shutdown(wait=False)
+        if self._session is not None:
+            self._session.close()
+        self._session = None
+        self._proxmox = None
+        self._cache.clear()
+        self._config_totals.clear()
+
+    def _get(self, path: str, **params: Any) -> Any:
+        """GET an API path on the shared session and return its data.
+
+        Read-only refresh calls skip proxmoxer's resource objects and go
+        straight through the authenticated session.
+        """
+        response = self._session.get(f"{self._base_url}/{path}", params=params or None)
+        response.raise_for_status()
+        # Decode the raw bytes natively instead of via requests' str + json
+        return orjson.loads(response.content)["data"]
 
     def test_connection(self) -> bool:
         """Test connection to Proxmox VE."""
@@ -57,311 +268,443 @@ class ProxmoxAPI:
         # This ensures lazy initialization of the connection
         try:
             self._connect()
-            self._proxmox.nodes.get()
+            # Smallest authenticated endpoint, enough to prove the login works
+            self._proxmox.version.get()
             return True
         except Exception as error:
             _LOGGER.error("Connection test failed: %s", error)
             raise
 
+    def _get_cluster_snapshot(self) -> Dict[str, List[Dict]]:
+        """Get all cluster resources from one listing, grouped by type.
+
+        An unfiltered cluster/resources call returns nodes, guests and
+        storages together, so the three getters share a single request.
+        """
+        return self._cache.get_or_fetch(
+            "resources", CACHE_TTL_NORMAL, self._fetch_cluster_snapshot, max_stale=0
+        )
+
+    def _fetch_cluster_snapshot(self) -> Dict[str, List[Dict]]:
+        """Fetch cluster resources and partition them by type."""
+        snapshot: Dict[str, List[Dict]] = {"node": [], "vm": [], "storage": []}
+        for resource in self._get("cluster/resources"):
+            resource_type = resource.get("type")
+            if resource_type in ("qemu", "lxc"):
+                snapshot["vm"].append(resource)
+            elif resource_type in snapshot:
+                snapshot[resource_type].append(resource)
+        return snapshot
+
     def get_nodes(self) -> List[Dict]:
         """Get all nodes in the cluster."""
         self._connect()
-        nodes = []
-        
-        for node in self._proxmox.nodes.get():
-            node_id = node["node"]
-            try:
-                # Get node status
-                status = self._proxmox.nodes(node_id).status.get()
-                
-                # Get resource usage
-                usage = {
-                    "cpu": status.get("cpu", 0),
-                    "memory": {
-                        "used": status.get("memory", {}).get("used", 0),
-                        "total": status.get("memory", {}).get("total", 0),
-                    },
-                    "uptime": status.get("uptime", 0),
-                }
-                
-                # Add disk usage info
-                disk_usage = {}
-                for disk in self._proxmox.nodes(node_id).disks.list.get():
-                    if "mount" in disk and disk["mount"] == "/":
-                        disk_usage = {
-                            "used": disk.get("used", 0),
-                            "total": disk.get("size", 0),
-                        }
-                        break
-                
-                nodes.append({
-                    "id": node_id,
-                    "name": node.get("name", node_id),
-                    "status": node.get("status", "unknown"),
-                    "cpu": usage["cpu"],
-                    "memory": usage["memory"],
-                    "disk": disk_usage,
-                    "uptime": usage["uptime"],
-                })
-            except Exception as error:
-                _LOGGER.error("Error getting status for node %s: %s", node_id, error)
-        
-        return nodes
-
-    def get_vms(self) -> List[Dict]:
-        """Get all VMs and LXC containers in the cluster."""
-        self._connect()
-        vms = []
-        
-        # Get all VMs and containers
-        for vm in self._proxmox.cluster.resources.get(type="vm"):
-            vm_id = vm["vmid"]
-            node = vm["node"]
-            vm_type = vm.get("type", "")  # 'qemu' for VMs, 'lxc' for containers
+        nodes = self._get_cluster_snapshot()["node"]
+        # Forget cached details of nodes that left the cluster
+        node_ids = {(node["node"],) for node in nodes}
+        self._cache.prune("node_status", node_ids)
+        self._cache.prune("node_disks", node_ids)
+        if not nodes:
+            return []
+
+        # Per-node calls are independent, so overlap their round trips
+        results = self._pool.map(self._fetch_node_detail, nodes)
+        return [node for node in results if node is not None]
+
+    def _fetch_node_detail(self, node: Dict) -> Optional[Dict]:
+        """Get status and root disk usage for a single node."""
+        node_id = node["node"]
+        try:
+            # Get node status
+            status = self._cache.get_or_fetch(
+                ("node_status", node_id),
+                CACHE_TTL_SHORT,
+                lambda: self._get(f"nodes/{node_id}/status"),
+                max_stale=0,
+            )
             
-            try:
-                # Different handling based on VM type
-                if vm_type == "lxc":
-                    # Handle LXC container
-                    try:
-                        config = self._proxmox.nodes(node).lxc(vm_id).config.get()
-                        
-                        # Try to get IP address
-                        ip_address = None
-                        try:
-                            # LXC IP address might be in the config
-                            for key, value in config.items():
-                                if key.startswith("net") and "ip=" in value:
-                                    ip_parts = value.split("ip=")[1].split("/")[0]
-                                    ip_address = ip_parts.split(",")[0]
-                                    break
-                        except Exception:
-                            pass
-                        
-                        # Get rootfs disk size
-                        total_disk = 0
-                        for key, value in config.items():
-                            if key.startswith(("rootfs", "mp")):
-                                # Parse size string (e.g., "32G")
-                                if "size=" in value:
-                                    size_str = value.split("size=")[1].split(",")[0]
-                                    try:
-                                        if size_str.endswith("G"):
-                                            size = float(size_str[:-1]) * 1024 * 1024 * 1024
-                                        elif size_str.endswith("M"):
-                                            size = float(size_str[:-1]) * 1024 * 1024
-                                        else:
-                                            size = float(size_str)
-                                        total_disk += size
-                                    except ValueError:
-                                        pass
-                        
-                        vms.append({
-                            "id": vm_id,
-                            "name": vm.get("name", f"Container {vm_id}"),
-                            "node": node,
-                            "type": "lxc",
-                            "status": vm.get("status", "unknown"),
-                            "cpu": {
-                                "used": vm.get("cpu", 0),
-                                "total": int(config.get("cores", 1)),
-                            },
-                            "memory": {
-                                "used": vm.get("mem", 0),
-                                "total": int(config.get("memory", 0)) * 1024 * 1024,  # Convert to bytes
-                            },
-                            "disk": {
-                                "total": total_disk,
-                            },
-                            "ip_address": ip_address,
-                        })
-                    except Exception as error:
-                        _LOGGER.error("Error getting details for LXC container %s: %s", vm_id, error)
+            # Get resource usage
+            usage = {
+                "cpu": status.get("cpu", 0),
+                "memory": {
+                    "used": status.get("memory", {}).get("used", 0),
+                    "total": status.get("memory", {}).get("total", 0),
+                },
+                "uptime": status.get("uptime", 0),
+            }
+            
+            # Add disk usage info
+            disk_usage = {}
+            disks = self._cache.get_or_fetch(
+                ("node_disks", node_id),
+                CACHE_TTL_LONG,
+                lambda: self._get(f"nodes/{node_id}/disks/list"),
+            )
+            for disk in disks:
+                if "mount" in disk and disk["mount"] == "/":
+                    disk_usage = {
+                        "used": disk.get("used", 0),
+                        "total": disk.get("size", 0),
+                    }
+                    break
+            
+            return {
+                "id": node_id,
+                "name": node.get("name", node_id),
+                "status": node.get("status", "unknown"),
+                "cpu": usage["cpu"],
+                "memory": usage["memory"],
+                "disk": disk_usage,
+                "uptime": usage["uptime"],
+            }
+        except Exception as error:
+            _LOGGER.error("Error getting status for node %s: %s", node_id, error)
+            return None
+
+    def get_vms(self, name_filter: Optional["re.Pattern[str]"] = None) -> List[Dict]:
+        """Get all VMs and LXC containers in the cluster.
+
+        If name_filter is given, only guests whose name or id it matches are
+        returned, and no per-guest calls are made for the others.
+        """
+        self._connect()
+        # cluster/resources already carries live usage and configured
+        # limits for every guest, so most refreshes need no other call
+        resources = self._get_cluster_snapshot()["vm"]
+        self._update_vm_type_cache(resources)
+        if name_filter is not None:
+            resources = [
+                vm
+                for vm in resources
+                if name_filter.match(vm.get("name", ""))
+                or name_filter.match(str(vm["vmid"]))
+            ]
+
+        # Forget cached addresses and configs of guests that no longer exist
+        for vm_id in self._ip_cache.keys() - self._vm_type_cache.keys():
+            del self._ip_cache[vm_id]
+        for vm_id in self._no_agent.keys() - self._vm_type_cache.keys():
+            del self._no_agent[vm_id]
+        for key in [key for key in self._config_totals if key[1] not in self._vm_type_cache]:
+            del self._config_totals[key]
+        # and cached configs of guests that moved or are filtered out
+        self._cache.prune(
+            "config", {(vm["node"], int(vm["vmid"])) for vm in resources}
+        )
+
+        if not resources:
+            return []
+
+        # Per-guest calls are independent, so overlap their round trips
+        results = self._pool.map(self._fetch_vm_detail, resources)
+        return [vm for vm in results if vm is not None]
+
+    def _fetch_vm_detail(self, vm: Dict) -> Optional[Dict]:
+        """Get details for a single VM or container."""
+        vm_id = int(vm["vmid"])
+        node = vm["node"]
+        # 'qemu' for VMs, 'lxc' for containers
+        vm_type = vm.get("type", "qemu")
+        status = vm.get("status", "unknown")
+        try:
+            cores = vm.get("maxcpu")
+            memory = vm.get("maxmem")
+            disk = vm.get("maxdisk")
+
+            # Older servers may omit the limits, read them from the config
+            if cores is None or memory is None or disk is None:
+                cores, memory, disk = self._get_config_totals(node, vm_id, vm_type)
+
+            # Serve the last known address between agent polls; entries
+            # age individually so polls are spread over several refreshes.
+            # A status change invalidates the entry, and a running guest
+            # without an address yet (e.g. still booting) is asked again
+            cached_ip = self._ip_cache.get(vm_id)
+            if (
+                cached_ip is None
+                or cached_ip[1] != status
+                or (status == STATUS_RUNNING and cached_ip[2] is None)
+                or time.monotonic() - cached_ip[0] >= IP_CACHE_TTL
+            ):
+                if status == STATUS_RUNNING and cached_ip is not None and cached_ip[1] != status:
+                    # The agent may have been enabled while the VM was down
+                    self._no_agent.pop(vm_id, None)
+                ip_address = self._get_ip_address(node, vm_id, vm_type, status)
+                cached_ip = (time.monotonic(), status, ip_address)
+                self._ip_cache[vm_id] = cached_ip
+
+            default_name = f"Container {vm_id}" if vm_type == "lxc" else f"VM {vm_id}"
+            return {
+                "id": vm_id,
+                "name": vm.get("name", default_name),
+                "node": node,
+                "type": vm_type,
+                "status": status,
+                "cpu": {
+                    "used": vm.get("cpu", 0),
+                    "total": int(cores),
+                },
+                "memory": {
+                    "used": vm.get("mem", 0),
+                    "total": memory,
+                },
+                "disk": {
+                    "total": disk,
+                },
+                "ip_address": cached_ip[2],
+            }
+        except Exception as error:
+            _LOGGER.error("Error processing VM/container %s: %s", vm_id, error)
+            return None
+
+    def _get_config(self, node: str, vm_id: int, vm_type: str) -> Dict:
+        """Get a guest config, served from cache while it is fresh."""
+        return self._cache.get_or_fetch(
+            ("config", node, vm_id),
+            CONFIG_CACHE_TTL,
+            lambda: self._get(f"nodes/{node}/{vm_type}/{vm_id}/config"),
+        )
+
+    def _get_config_totals(self, node: str, vm_id: int, vm_type: str) -> Tuple[int, int, int]:
+        """Get configured cores, memory and disk size (bytes) from a guest config."""
+        config = self._get_config(node, vm_id, vm_type)
+        # The digest changes with every config edit, so reuse the last parse
+        digest = config.get("digest")
+        cached = self._config_totals.get((node, vm_id))
+        if digest and cached is not None and cached[0] == digest:
+            return cached[1]
+
+        if vm_type == "lxc":
+            # Get rootfs and mount point sizes
+            total_disk = 0
+            for key, value in config.items():
+                if _LXC_MOUNT_KEY_RE.match(key):
+                    # Parse size string (e.g., "size=32G")
+                    match = _SIZE_RE.search(value)
+                    if match:
+                        total_disk += _size_bytes(match)
+        else:
+            # Get disks for storage info; the API returns plain strings like
+            # "local-lvm:vm-100-disk-0,size=32G", older wrappers dicts
+            total_disk = 0
+            for key, value in config.items():
+                if not _QEMU_DISK_KEY_RE.match(key):
+                    continue
+                # Attached ISOs carry a size too, but are not guest disks
+                if isinstance(value, dict):
+                    if value.get("media") == "cdrom":
+                        continue
+                    match = _SIZE_RE.search(f"size={value.get('size', '0')}")
+                elif "media=cdrom" in value:
+                    continue
                 else:
-                    # Handle QEMU VM
-                    try:
-                        config = self._proxmox.nodes(node).qemu(vm_id).config.get()
-                        
-                        # Try to get IP address
-                        ip_address = None
-                        try:
-                            agent_network = self._proxmox.nodes(node).qemu(vm_id).agent.get("network-get-interfaces")
-                            for interface in agent_network.get("result", []):
-                                for ip_info in interface.get("ip-addresses", []):
-                                    if ip_info.get("ip-address-type") == "ipv4":
-                                        ip_address = ip_info.get("ip-address")
-                                        break
-                                if ip_address:
-                                    break
-                        except Exception:
-                            # Agent might not be running
-                            pass
-                        
-                        # Get disks for storage info
-                        disks = {}
-                        for key, value in config.items():
-                            if key.startswith(("ide", "sata", "scsi", "virtio")):
-                                if isinstance(value, dict) and "size" in value:
-                                    disks[key] = value
-                        
-                        total_disk = 0
-                        for disk in disks.values():
-                            # Parse size string (e.g., "32G")
-                            if isinstance(disk, dict):
-                                size_str = disk.get("size", "0")
-                            elif isinstance(disk, str) and "size=" in disk:
-                                # Handle string format if it exists
-                                size_str = disk.split("size=")[1].split(",")[0]
-                            else:
-                                size_str = "0"
-                            try:
-                                if size_str.endswith("G"):
-                                    size = float(size_str[:-1]) * 1024 * 1024 * 1024
-                                elif size_str.endswith("M"):
-                                    size = float(size_str[:-1]) * 1024 * 1024
-                                else:
-                                    size = float(size_str)
-                                total_disk += size
-                            except ValueError:
-                                pass
-                        
-                        vms.append({
-                            "id": vm_id,
-                            "name": vm.get("name", f"VM {vm_id}"),
-                            "node": node,
-                            "type": "qemu",
-                            "status": vm.get("status", "unknown"),
-                            "cpu": {
-                                "used": vm.get("cpu", 0),
-                                "total": config.get("cores", 1),
-                            },
-                            "memory": {
-                                "used": vm.get("mem", 0),
-                                "total": config.get("memory", 0) * 1024 * 1024,  # Convert to bytes
-                            },
-                            "disk": {
-                                "total": total_disk,
-                            },
-                            "ip_address": ip_address,
-                        })
-                    except Exception as error:
-                        _LOGGER.error("Error getting details for VM %s: %s", vm_id, error)
-            except Exception as error:
-                _LOGGER.error("Error processing VM/container %s: %s", vm_id, error)
-        
-        return vms
+                    match = _SIZE_RE.search(value)
+                if match:
+                    total_disk += _size_bytes(match)
+
+        cores = int(config.get("cores", 1))
+        memory = int(config.get("memory", 0)) * 1024 * 1024  # Convert to bytes
+        if digest:
+            self._config_totals[(node, vm_id)] = (digest, (cores, memory, total_disk))
+        return cores, memory, total_disk
+
+    def _get_ip_address(
+        self, node: str, vm_id: int, vm_type: str, status: str
+    ) -> Optional[str]:
+        """Get the IPv4 address of a guest, if it can be determined."""
+        # Only a running VM can have a guest agent to ask, and one that
+        # recently reported it has none is not asked again for a while
+        if vm_type != "lxc" and (
+            status != STATUS_RUNNING
+            or time.monotonic() < self._no_agent.get(vm_id, 0.0)
+        ):
+            return None
+
+        try:
+            if vm_type == "lxc":
+                # LXC IP address might be in the config
+                config = self._get_config(node, vm_id, vm_type)
+                for key, value in config.items():
+                    if key.startswith("net"):
+                        match = _IP_RE.search(value)
+                        if match:
+                            return match.group(1)
+                return None
+
+            agent_network = self._get(f"nodes/{node}/qemu/{vm_id}/agent/network-get-interfaces")
+            # First non-loopback IPv4 address of any interface
+            return next(
+                (
+                    ip_info["ip-address"]
+                    for interface in agent_network.get("result", ())
+                    for ip_info in interface.get("ip-addresses", ())
+                    if ip_info.get("ip-address-type") == "ipv4"
+                    and not ip_info.get("ip-address", "127.").startswith("127.")
+                ),
+                None,
+            )
+        except Exception as error:
+            if vm_type != "lxc":
+                _LOGGER.debug("Guest agent of VM %s unavailable: %s", vm_id, error)
+                # Back off only if the agent is not enabled; timeouts and an
+                # agent that is not running yet are retried next refresh
+                if _agent_not_configured(error):
+                    self._no_agent[vm_id] = time.monotonic() + NO_AGENT_COOLDOWN
+        return None
 
     def get_storages(self) -> List[Dict]:
         """Get all storage devices in the cluster."""
         self._connect()
-        storages = []
-        
-        for storage in self._proxmox.cluster.resources.get(type="storage"):
-            storage_id = storage["storage"]
-            node = storage.get("node")
-            
-            # Skip if not node-specific storage
-            if not node:
-                continue
-            
-            try:
-                storages.append({
-                    "id": storage_id,
-                    "node": node,
-                    "type": storage.get("type", "unknown"),
-                    "status": storage.get("status", "unknown"),
-                    "disk": {
-                        "used": storage.get("used", 0),
-                        "total": storage.get("total", 0),
-                    },
-                })
-            except Exception as error:
-                _LOGGER.error("Error getting storage %s: %s", storage_id, error)
-        
-        return storages
+
+        # Skip storages that are not node-specific
+        return [
+            {
+                "id": storage["storage"],
+                "node": storage["node"],
+                "type": storage.get("type", "unknown"),
+                "status": storage.get("status", "unknown"),
+                "disk": {
+                    "used": storage.get("used", 0),
+                    "total": storage.get("total", 0),
+                },
+            }
+            for storage in self._get_cluster_snapshot()["storage"]
+            if storage.get("node")
+        ]
+
+    def _update_vm_type_cache(self, resources: List[Dict]) -> None:
+        """Remember the type of every guest from a cluster resources listing."""
+        self._vm_type_cache = {
+            int(vm["vmid"]): vm.get("type", "qemu") for vm in resources
+        }
+        self._vm_type_cache_time = time.monotonic()
 
     def _get_vm_type(self, node_id: str, vm_id: int) -> str:
         """Determine if a VM is a QEMU VM or LXC container."""
+        # Serve from the map built during the last refresh while it is fresh
+        if time.monotonic() - self._vm_type_cache_time < VM_TYPE_CACHE_TTL:
+            vm_type = self._vm_type_cache.get(int(vm_id))
+            if vm_type is not None:
+                return vm_type
+
         self._connect()
-        for vm in self._proxmox.cluster.resources.get(type="vm"):
-            if str(vm["vmid"]) == str(vm_id) and vm["node"] == node_id:
+        resources = self._get("cluster/resources", type="vm")
+        self._update_vm_type_cache(resources)
+        for vm in resources:
+            if int(vm["vmid"]) == int(vm_id) and vm["node"] == node_id:
                 return vm.get("type", "qemu")
         return "qemu"  # Default to qemu if not found
 
-    def start_vm(self, node_id: str, vm_id: int) -> bool:
+    def _invalidate_listing(self) -> None:
+        """Drop the cached cluster listing after a power action.
+
+        The refresh that follows an action should see its effect rather
+        than the listing fetched just before it.
+        """
+        self._cache.discard("resources")
+
+    def start_vm(
+        self, node_id: str, vm_id: int, vm_type: Optional[str] = None
+    ) -> bool:
         """Start a VM or container."""
         try:
             self._connect()
-            vm_type = self._get_vm_type(node_id, vm_id)
+            if vm_type is None:
+                vm_type = self._get_vm_type(node_id, vm_id)
             
             if vm_type == "lxc":
                 self._proxmox.nodes(node_id).lxc(vm_id).status.start.post()
             else:
                 self._proxmox.nodes(node_id).qemu(vm_id).status.start.post()
+            self._invalidate_listing()
             return True
         except Exception as error:
             _LOGGER.error("Error starting VM/container %s: %s", vm_id, error)
             return False
 
-    def shutdown_vm(self, node_id: str, vm_id: int) -> bool:
+    def shutdown_vm(
+        self, node_id: str, vm_id: int, vm_type: Optional[str] = None
+    ) -> bool:
         """Shutdown a VM or container gracefully."""
         try:
             self._connect()
-            vm_type = self._get_vm_type(node_id, vm_id)
+            if vm_type is None:
+                vm_type = self._get_vm_type(node_id, vm_id)
             
             if vm_type == "lxc":
                 self._proxmox.nodes(node_id).lxc(vm_id).status.shutdown.post()
             else:
                 self._proxmox.nodes(node_id).qemu(vm_id).status.shutdown.post()
+            self._invalidate_listing()
             return True
         except Exception as error:
             _LOGGER.error("Error shutting down VM/container %s: %s", vm_id, error)
             return False
 
-    def restart_vm(self, node_id: str, vm_id: int) -> bool:
+    def restart_vm(
+        self, node_id: str, vm_id: int, vm_type: Optional[str] = None
+    ) -> bool:
         """Restart a VM or container gracefully."""
         try:
             self._connect()
-            vm_type = self._get_vm_type(node_id, vm_id)
+            if vm_type is None:
+                vm_type = self._get_vm_type(node_id, vm_id)
             
             if vm_type == "lxc":
                 self._proxmox.nodes(node_id).lxc(vm_id).status.reboot.post()
             else:
                 self._proxmox.nodes(node_id).qemu(vm_id).status.reboot.post()
+            self._invalidate_listing()
             return True
         except Exception as error:
             _LOGGER.error("Error restarting VM/container %s: %s", vm_id, error)
             return False
 
-    def force_stop_vm(self, node_id: str, vm_id: int) -> bool:
+    def force_stop_vm(
+        self, node_id: str, vm_id: int, vm_type: Optional[str] = None
+    ) -> bool:
         """Force stop a VM or container."""
         try:
             self._connect()
-            vm_type = self._get_vm_type(node_id, vm_id)
+            if vm_type is None:
+                vm_type = self._get_vm_type(node_id, vm_id)
             
             if vm_type == "lxc":
                 self._proxmox.nodes(node_id).lxc(vm_id).status.stop.post()
             else:
                 self._proxmox.nodes(node_id).qemu(vm_id).status.stop.post()
+            self._invalidate_listing()
             return True
         except Exception as error:
             _LOGGER.error("Error force stopping VM/container %s: %s", vm_id, error)
             return False
 
-    def force_restart_vm(self, node_id: str, vm_id: int) -> bool:
+    def force_restart_vm(
+        self, node_id: str, vm_id: int, vm_type: Optional[str] = None
+    ) -> bool:
         """Force restart a VM or container."""
         try:
             self._connect()
-            vm_type = self._get_vm_type(node_id, vm_id)
+            if vm_type is None:
+                vm_type = self._get_vm_type(node_id, vm_id)
             
-            if vm_type == "lxc":
-                # First stop, then start for LXC
-                self._proxmox.nodes(node_id).lxc(vm_id).status.stop.post()
-                self._proxmox.nodes(node_id).lxc(vm_id).status.start.post()
-            else:
-                # First stop, then start for QEMU
-                self._proxmox.nodes(node_id).qemu(vm_id).status.stop.post()
-                self._proxmox.nodes(node_id).qemu(vm_id).status.start.post()
+            guest = self._proxmox.nodes(node_id)(vm_type)(vm_id)
+            status_path = f"nodes/{node_id}/{vm_type}/{vm_id}/status/current"
+            # Stop runs as a background task, so wait for it to finish
+            # before starting again; a full stop and start also applies
+            # pending config changes, which a QEMU reset would not. A guest
+            # that is already stopped is simply started
+            if self._get(status_path).get("status") != "stopped":
+                guest.status.stop.post()
+                deadline = time.monotonic() + FORCE_RESTART_TIMEOUT
+                delay = 0.05
+                while self._get(status_path).get("status") != "stopped":
+                    if time.monotonic() >= deadline:
+                        raise TimeoutError("guest did not stop in time")
+                    time.sleep(delay)
+                    delay = min(delay * 2, 1.0)
+            guest.status.start.post()
+            self._invalidate_listing()
             return True
         except Exception as error:
             _LOGGER.error("Error force restarting VM/container %s: %s", vm_id, error)
@@ -372,6 +715,7 @@ class ProxmoxAPI:
         try:
             self._connect()
             self._proxmox.nodes(node_id).status.shutdown.post()
+            self._invalidate_listing()
             return True
         except Exception as error:
             _LOGGER.error("Error shutting down node %s: %s", node_id, error)
@@ -382,6 +726,7 @@ class ProxmoxAPI:
         try:
             self._connect()
             self._proxmox.nodes(node_id).status.reboot.post()
+            self._invalidate_listing()
             return True
         except Exception as error:
             _LOGGER.error("Error restarting node %s: %s", node_id, error)
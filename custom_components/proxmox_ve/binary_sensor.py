@@ -19,8 +19,8 @@ from .const import (
     DOMAIN,
     CATEGORY_NODE,
     CATEGORY_VM,
-    STATUS_RUNNING,
 )
+from .entity import vm_unchanged
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,25 +31,27 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Proxmox VE binary sensors."""
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+    data = hass.data[DOMAIN][config_entry.entry_id]
+    vm_coordinator = data["vm_coordinator"]
+    node_coordinator = data["node_coordinator"]
     
     entities = []
     
     # Add VM status sensors
-    for vm in coordinator.data.get("vms", []):
+    for vm in vm_coordinator.data["vms"]:
         entities.append(
             ProxmoxVMStatusSensor(
-                coordinator, 
+                vm_coordinator, 
                 vm["id"], 
                 config_entry.entry_id
             )
         )
     
     # Add Node status sensors
-    for node in coordinator.data.get("nodes", []):
+    for node in node_coordinator.data["nodes"]:
         entities.append(
             ProxmoxNodeStatusSensor(
-                coordinator, 
+                node_coordinator, 
                 node["id"], 
                 config_entry.entry_id
             )
@@ -66,59 +68,49 @@ class ProxmoxVMStatusSensor(CoordinatorEntity, BinarySensorEntity):
     def __init__(
         self, 
         coordinator: DataUpdateCoordinator, 
-        vm_id: str, 
+        vm_id: int, 
         entry_id: str
     ) -> None:
         """Initialize the sensor."""
-        # Explicitly initialize the CoordinatorEntity parent class
-        CoordinatorEntity.__init__(self, coordinator)
-        self.coordinator = coordinator
-        self._vm_id = vm_id
+        super().__init__(coordinator)
+        self._vm_id = int(vm_id)
         self._entry_id = entry_id
         self._attr_unique_id = f"{DOMAIN}_{entry_id}_vm_{vm_id}_status"
+        # Device identity never changes, only its name and parent node do
+        self._device_identifiers = {(DOMAIN, f"vm_{vm_id}")}
+        self._fallback_name = f"VM {vm_id}"
         self._vm_data = self._get_vm_data()
+        self._update_attrs()
     
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        if vm_unchanged(self.coordinator, self._vm_id):
+            return
         self._vm_data = self._get_vm_data()
+        self._update_attrs()
         self.async_write_ha_state()
 
     def _get_vm_data(self) -> Optional[Dict[str, Any]]:
         """Get current VM data from coordinator."""
-        for vm in self.coordinator.data.get("vms", []):
-            if str(vm["id"]) == str(self._vm_id):
-                return vm
-        return None
+        return self.coordinator.data["vms_by_id"].get(self._vm_id)
 
-    @property
-    def name(self) -> str:
-        """Return the name of the entity."""
-        if self._vm_data and self._vm_data.get("name"):
-            return f"{self._vm_data['name']} Status"
-        return f"VM {self._vm_id} Status"
-
-    @property
-    def is_on(self) -> bool:
-        """Return true if the VM is running."""
+    def _update_attrs(self) -> None:
+        """Compute state and attributes once per update, not on every read."""
         if not self._vm_data:
-            return False
-        return self._vm_data.get("status") == STATUS_RUNNING
-
-    @property
-    def icon(self) -> str:
-        """Return the icon of the sensor."""
-        if self.is_on:
-            return "mdi:server"
-        return "mdi:server-off"
-
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return extra state attributes."""
-        if not self._vm_data:
-            return {}
-        
-        return {
+            self._attr_name = f"VM {self._vm_id} Status"
+            self._attr_is_on = False
+            self._attr_icon = "mdi:server-off"
+            self._attr_extra_state_attributes = {}
+            return
+
+        if self._vm_data.get("name"):
+            self._attr_name = f"{self._vm_data['name']} Status"
+        else:
+            self._attr_name = f"VM {self._vm_id} Status"
+        self._attr_is_on = self._vm_data["is_running"]
+        self._attr_icon = "mdi:server" if self._attr_is_on else "mdi:server-off"
+        self._attr_extra_state_attributes = {
             "node": self._vm_data.get("node", ""),
             "status": self._vm_data.get("status", "unknown"),
             "vm_id": self._vm_id,
@@ -128,12 +120,19 @@ class ProxmoxVMStatusSensor(CoordinatorEntity, BinarySensorEntity):
     @property
     def device_info(self) -> DeviceInfo:
         """Return device registry information."""
+        if not self._vm_data:
+            return DeviceInfo(
+                identifiers=self._device_identifiers,
+                name=self._fallback_name,
+                manufacturer="Proxmox VE",
+                model="Virtual Machine",
+            )
         return DeviceInfo(
-            identifiers={(DOMAIN, f"vm_{self._vm_id}")},
-            name=self._vm_data.get("name", f"VM {self._vm_id}") if self._vm_data else f"VM {self._vm_id}",
+            identifiers=self._device_identifiers,
+            name=self._vm_data.get("name", self._fallback_name),
             manufacturer="Proxmox VE",
             model="Virtual Machine",
-            via_device=(DOMAIN, f"node_{self._vm_data.get('node')}" if self._vm_data else None),
+            via_device=(DOMAIN, f"node_{self._vm_data['node']}"),
         )
 
 
@@ -149,55 +148,42 @@ class ProxmoxNodeStatusSensor(CoordinatorEntity, BinarySensorEntity):
         entry_id: str
     ) -> None:
         """Initialize the sensor."""
-        # Explicitly initialize the CoordinatorEntity parent class
-        CoordinatorEntity.__init__(self, coordinator)
-        self.coordinator = coordinator
+        super().__init__(coordinator)
         self._node_id = node_id
         self._entry_id = entry_id
         self._attr_unique_id = f"{DOMAIN}_{entry_id}_node_{node_id}_status"
+        self._device_identifiers = {(DOMAIN, f"node_{node_id}")}
+        self._fallback_name = f"Node {node_id}"
         self._node_data = self._get_node_data()
+        self._update_attrs()
     
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         self._node_data = self._get_node_data()
+        self._update_attrs()
         self.async_write_ha_state()
 
     def _get_node_data(self) -> Optional[Dict[str, Any]]:
         """Get current node data from coordinator."""
-        for node in self.coordinator.data.get("nodes", []):
-            if node["id"] == self._node_id:
-                return node
-        return None
-
-    @property
-    def name(self) -> str:
-        """Return the name of the entity."""
-        if self._node_data and self._node_data.get("name"):
-            return f"{self._node_data['name']} Status"
-        return f"Node {self._node_id} Status"
+        return self.coordinator.data["nodes_by_id"].get(self._node_id)
 
-    @property
-    def is_on(self) -> bool:
-        """Return true if the node is online."""
-        if not self._node_data:
-            return False
-        return self._node_data.get("status") == "online"
-
-    @property
-    def icon(self) -> str:
-        """Return the icon of the sensor."""
-        if self.is_on:
-            return "mdi:server-network"
-        return "mdi:server-network-off"
-
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return extra state attributes."""
+    def _update_attrs(self) -> None:
+        """Compute state and attributes once per update, not on every read."""
         if not self._node_data:
-            return {}
-        
-        return {
+            self._attr_name = f"Node {self._node_id} Status"
+            self._attr_is_on = False
+            self._attr_icon = "mdi:server-network-off"
+            self._attr_extra_state_attributes = {}
+            return
+
+        if self._node_data.get("name"):
+            self._attr_name = f"{self._node_data['name']} Status"
+        else:
+            self._attr_name = f"Node {self._node_id} Status"
+        self._attr_is_on = self._node_data["is_online"]
+        self._attr_icon = "mdi:server-network" if self._attr_is_on else "mdi:server-network-off"
+        self._attr_extra_state_attributes = {
             "node_id": self._node_id,
             "status": self._node_data.get("status", "unknown"),
             "uptime": self._node_data.get("uptime", 0),
@@ -208,8 +194,12 @@ class ProxmoxNodeStatusSensor(CoordinatorEntity, BinarySensorEntity):
     def device_info(self) -> DeviceInfo:
         """Return device registry information."""
         return DeviceInfo(
-            identifiers={(DOMAIN, f"node_{self._node_id}")},
-            name=self._node_data.get("name", f"Node {self._node_id}") if self._node_data else f"Node {self._node_id}",
+            identifiers=self._device_identifiers,
+            name=(
+                self._node_data.get("name", self._fallback_name)
+                if self._node_data
+                else self._fallback_name
+            ),
             manufacturer="Proxmox VE",
             model="Node",
         )
@@ -1,6 +1,8 @@
 """Button platform for Proxmox VE."""
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterator, NamedTuple, Optional
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
@@ -13,72 +15,115 @@ from homeassistant.helpers.update_coordinator import (
 )
 
 from .api import ProxmoxAPI
-from .const import (
-    DOMAIN,
-    CATEGORY_VM,
-    CATEGORY_NODE,
-    STATUS_RUNNING,
-)
+from .const import DOMAIN
+from .entity import vm_unchanged
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class VMAction(NamedTuple):
+    """Static description of a VM power button."""
+
+    key: str
+    name: str
+    icon: str
+    api_method: str
+    available: Callable[[Dict[str, Any]], bool]
+
+
+# Availability predicates on a coordinator row; is_running is derived once
+# per refresh, so these are a single item lookup
+_WHEN_RUNNING = itemgetter("is_running")
+
+
+def _when_stopped(vm: Dict[str, Any]) -> bool:
+    """Return true if the guest is not running."""
+    return not vm["is_running"]
+
+
+def _always(vm: Dict[str, Any]) -> bool:
+    """Return true regardless of the guest's state."""
+    return True
+
+
+VM_ACTIONS = (
+    VMAction("start", "Start", "mdi:play", "start_vm", _when_stopped),
+    VMAction("shutdown", "Shutdown", "mdi:stop", "shutdown_vm", _WHEN_RUNNING),
+    VMAction("restart", "Restart", "mdi:restart", "restart_vm", _WHEN_RUNNING),
+    VMAction("force_stop", "Force Stop", "mdi:stop-circle", "force_stop_vm", _WHEN_RUNNING),
+    VMAction(
+        "force_restart", "Force Restart", "mdi:restart-alert", "force_restart_vm", _always
+    ),
+)
+
+
+class NodeAction(NamedTuple):
+    """Static description of a node power button."""
+
+    key: str
+    name: str
+    icon: str
+    api_method: str
+
+
+NODE_ACTIONS = (
+    NodeAction("shutdown", "Shutdown", "mdi:power", "shutdown_node"),
+    NodeAction("restart", "Restart", "mdi:restart", "restart_node"),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Proxmox VE buttons."""
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
-    api = hass.data[DOMAIN][config_entry.entry_id]["api"]
-    
-    entities = []
-    
-    # Add VM buttons
-    for vm in coordinator.data.get("vms", []):
-        vm_id = vm["id"]
-        node_id = vm["node"]
-        
-        # Start button (only for stopped VMs)
-        entities.append(
-            ProxmoxVMStartButton(coordinator, api, vm_id, node_id, config_entry.entry_id)
-        )
-        
-        # Shutdown button (only for running VMs)
-        entities.append(
-            ProxmoxVMShutdownButton(coordinator, api, vm_id, node_id, config_entry.entry_id)
-        )
-        
-        # Restart button
-        entities.append(
-            ProxmoxVMRestartButton(coordinator, api, vm_id, node_id, config_entry.entry_id)
-        )
-        
-        # Force stop button
-        entities.append(
-            ProxmoxVMForceStopButton(coordinator, api, vm_id, node_id, config_entry.entry_id)
-        )
-        
-        # Force restart button
-        entities.append(
-            ProxmoxVMForceRestartButton(coordinator, api, vm_id, node_id, config_entry.entry_id)
-        )
-    
-    # Add Node buttons
-    for node in coordinator.data.get("nodes", []):
-        node_id = node["id"]
-        
-        # Shutdown node button
-        entities.append(
-            ProxmoxNodeShutdownButton(coordinator, api, node_id, config_entry.entry_id)
-        )
-        
-        # Restart node button
-        entities.append(
-            ProxmoxNodeRestartButton(coordinator, api, node_id, config_entry.entry_id)
-        )
-    
-    async_add_entities(entities)
+    data = hass.data[DOMAIN][config_entry.entry_id]
+    vm_coordinator = data["vm_coordinator"]
+    node_coordinator = data["node_coordinator"]
+    api = data["api"]
+    
+    entry_id = config_entry.entry_id
+    
+    def _iter_entities() -> Iterator[ProxmoxButtonBase]:
+        """Yield every button, without building an intermediate list."""
+        # VM buttons
+        for vm in vm_coordinator.data["vms"]:
+            # Shared by all buttons of this VM, so build them only once
+            vm_id = vm["id"]
+            unique_id_prefix = f"{DOMAIN}_{entry_id}_vm_{vm_id}_"
+            device_id = f"vm_{vm_id}"
+            device_info = DeviceInfo(
+                identifiers={(DOMAIN, device_id)},
+                name=vm["name"],
+                manufacturer="Proxmox VE",
+                model="Virtual Machine",
+                via_device=(DOMAIN, f"node_{vm['node']}"),
+            )
+            for action in VM_ACTIONS:
+                yield ProxmoxVMActionButton(
+                    vm_coordinator, api, vm_id, vm["node"], entry_id, action,
+                    unique_id_prefix, device_info,
+                )
+        
+        # Node buttons
+        for node in node_coordinator.data["nodes"]:
+            node_id = node["id"]
+            unique_id_prefix = f"{DOMAIN}_{entry_id}_node_{node_id}_"
+            device_id = f"node_{node_id}"
+            device_info = DeviceInfo(
+                identifiers={(DOMAIN, device_id)},
+                name=node["name"],
+                manufacturer="Proxmox VE",
+                model="Node",
+            )
+            for action in NODE_ACTIONS:
+                yield ProxmoxNodeActionButton(
+                    node_coordinator, api, node_id, entry_id, action,
+                    unique_id_prefix, device_info,
+                )
+    
+    async_add_entities(_iter_entities())
 
 
 class ProxmoxButtonBase(CoordinatorEntity, ButtonEntity):
@@ -93,387 +138,118 @@ class ProxmoxButtonBase(CoordinatorEntity, ButtonEntity):
         unique_id: str,
         name: str,
         icon: str,
-        device_type: str,
-        device_id: str,
-        device_name: str,
-        via_device: Optional[tuple] = None,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the button."""
-        # Explicitly initialize the CoordinatorEntity parent class
-        CoordinatorEntity.__init__(self, coordinator)
-        self.coordinator = coordinator
+        super().__init__(coordinator)
         self._api = api
         self._attr_unique_id = unique_id
         self._attr_name = name
         self._attr_icon = icon
-        self._device_type = device_type
-        self._device_id = device_id
-        self._device_name = device_name
-        self._via_device = via_device
         self._available = True
+        # One DeviceInfo per device, shared by all of its buttons
+        self._attr_device_info = device_info
     
     async def async_press(self) -> None:
         """Press the button."""
-        await self.hass.async_add_executor_job(self._action)
-    
-    def _action(self) -> None:
-        """Action to perform when pressing the button."""
-        pass
-    
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self._available
-    
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device registry information."""
-        device_info = DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=self._device_name,
-            manufacturer="Proxmox VE",
+        # Proxmox can take seconds to answer, don't hold up the caller
+        self.hass.async_create_background_task(
+            self._async_run_action(), name=f"{DOMAIN} {self.unique_id}"
         )
-        
-        if self._device_type == CATEGORY_VM:
-            device_info["model"] = "Virtual Machine"
-            if self._via_device:
-                device_info["via_device"] = self._via_device
-        elif self._device_type == CATEGORY_NODE:
-            device_info["model"] = "Node"
-        
-        return device_info
-
-
-class ProxmoxVMStartButton(ProxmoxButtonBase):
-    """Button to start a VM or container."""
-    
-    def __init__(
-        self,
-        coordinator: DataUpdateCoordinator,
-        api: ProxmoxAPI,
-        vm_id: str,
-        node_id: str,
-        entry_id: str,
-    ) -> None:
-        """Initialize the button."""
-        # Set up basic attributes and coordinator first
-        self.coordinator = coordinator
-        self._api = api
-        self._vm_id = vm_id
-        self._node_id = node_id
-        self._entry_id = entry_id
-        
-        # Set up parent classes
-        CoordinatorEntity.__init__(self, coordinator)
-        
-        # Set basic attributes
-        unique_id = f"{DOMAIN}_{entry_id}_vm_{vm_id}_start"
-        self._attr_unique_id = unique_id
-        self._attr_name = "Start"
-        self._attr_icon = "mdi:play"
-        self._device_type = CATEGORY_VM
-        self._device_id = f"vm_{vm_id}"
-        self._available = True
-        
-        # Now get VM data after coordinator is available
-        self._vm_data = self._get_vm_data()
-        
-        # Set device name based on VM data
-        self._device_name = self._vm_data.get("name", f"VM {vm_id}") if self._vm_data else f"VM {vm_id}"
-        self._via_device = (DOMAIN, f"node_{node_id}")
-        
-        # Update availability based on VM state
-        self._update_availability()
-    
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._vm_data = self._get_vm_data()
-        self._update_availability()
-        self.async_write_ha_state()
-    
-    def _get_vm_data(self) -> Optional[Dict[str, Any]]:
-        """Get current VM data from coordinator."""
-        for vm in self.coordinator.data.get("vms", []):
-            if str(vm["id"]) == str(self._vm_id):
-                return vm
-        return None
     
-    def _update_availability(self) -> None:
-        """Update availability based on VM status."""
-        if not self._vm_data:
-            self._available = False
+    async def _async_run_action(self) -> None:
+        """Run the action in the executor, then refresh the coordinator."""
+        # Repeated presses while this action is in flight are dropped rather
+        # than queued; the locks live with the entry and go away with it
+        locks = self.hass.data[DOMAIN][self._entry_id]["action_locks"]
+        lock = locks.setdefault(self.unique_id, asyncio.Lock())
+        if lock.locked():
+            _LOGGER.warning("Ignoring %s, it is already running", self.unique_id)
             return
-        
-        # Start button is only available when VM is stopped
-        self._available = self._vm_data.get("status") != STATUS_RUNNING
+        async with lock:
+            await self.hass.async_add_executor_job(self._action)
+        await self.coordinator.async_request_refresh()
     
     def _action(self) -> None:
-        """Start the VM."""
-        self._api.start_vm(self._node_id, self._vm_id)
-
-
-class ProxmoxVMShutdownButton(ProxmoxButtonBase):
-    """Button to shutdown a VM or container."""
+        """Action to perform when pressing the button."""
+        pass
     
-    def __init__(
-        self,
-        coordinator: DataUpdateCoordinator,
-        api: ProxmoxAPI,
-        vm_id: str,
-        node_id: str,
-        entry_id: str,
-    ) -> None:
-        """Initialize the button."""
-        # Set up basic attributes and coordinator first
-        self.coordinator = coordinator
-        self._api = api
-        self._vm_id = vm_id
-        self._node_id = node_id
-        self._entry_id = entry_id
-        
-        # Set up parent classes
-        CoordinatorEntity.__init__(self, coordinator)
-        
-        # Set basic attributes
-        unique_id = f"{DOMAIN}_{entry_id}_vm_{vm_id}_shutdown"
-        self._attr_unique_id = unique_id
-        self._attr_name = "Shutdown"
-        self._attr_icon = "mdi:stop"
-        self._device_type = CATEGORY_VM
-        self._device_id = f"vm_{vm_id}"
-        self._available = True
-        
-        # Now get VM data after coordinator is available
-        self._vm_data = self._get_vm_data()
-        
-        # Set device name based on VM data
-        self._device_name = self._vm_data.get("name", f"VM {vm_id}") if self._vm_data else f"VM {vm_id}"
-        self._via_device = (DOMAIN, f"node_{node_id}")
-        
-        # Update availability based on VM state
-        self._update_availability()
+    def _update_data(self) -> None:
+        """Fetch this button's row and update its availability."""
+        pass
     
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self._vm_data = self._get_vm_data()
-        self._update_availability()
-        self.async_write_ha_state()
-    
-    def _get_vm_data(self) -> Optional[Dict[str, Any]]:
-        """Get current VM data from coordinator."""
-        for vm in self.coordinator.data.get("vms", []):
-            if str(vm["id"]) == str(self._vm_id):
-                return vm
-        return None
-    
-    def _update_availability(self) -> None:
-        """Update availability based on VM status."""
-        if not self._vm_data:
-            self._available = False
+        if not self.coordinator.last_update_success:
+            # A failed refresh keeps the previous data, and a button's
+            # availability does not follow the coordinator's
             return
-        
-        # Shutdown button is only available when VM is running
-        self._available = self._vm_data.get("status") == STATUS_RUNNING
+        was_available = self._available
+        self._update_data()
+        # Availability is the only state a button derives from the data
+        if self._available != was_available:
+            self.async_write_ha_state()
     
-    def _action(self) -> None:
-        """Shutdown the VM."""
-        self._api.shutdown_vm(self._node_id, self._vm_id)
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return self._available
 
 
-class ProxmoxVMRestartButton(ProxmoxButtonBase):
-    """Button to restart a VM or container."""
+class ProxmoxVMActionButton(ProxmoxButtonBase):
+    """Button to run a power action on a VM or container."""
     
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
         api: ProxmoxAPI,
-        vm_id: str,
+        vm_id: int,
         node_id: str,
         entry_id: str,
+        action: VMAction,
+        unique_id_prefix: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the button."""
-        # Set up basic attributes and coordinator first
-        self.coordinator = coordinator
-        self._api = api
-        self._vm_id = vm_id
+        self._vm_id = int(vm_id)
         self._node_id = node_id
         self._entry_id = entry_id
-        
-        # Set up parent classes
-        CoordinatorEntity.__init__(self, coordinator)
-        
-        # Set basic attributes
-        unique_id = f"{DOMAIN}_{entry_id}_vm_{vm_id}_restart"
-        self._attr_unique_id = unique_id
-        self._attr_name = "Restart"
-        self._attr_icon = "mdi:restart"
-        self._device_type = CATEGORY_VM
-        self._device_id = f"vm_{vm_id}"
-        self._available = True
-        
-        # Now get VM data after coordinator is available
-        self._vm_data = self._get_vm_data()
-        
-        # Set device name based on VM data
-        self._device_name = self._vm_data.get("name", f"VM {vm_id}") if self._vm_data else f"VM {vm_id}"
-        self._via_device = (DOMAIN, f"node_{node_id}")
+        self._vm_action = action
+        
+        super().__init__(
+            coordinator,
+            api,
+            unique_id_prefix + action.key,
+            action.name,
+            action.icon,
+            device_info,
+        )
         
         # Update availability based on VM state
-        self._update_availability()
-    
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
         self._vm_data = self._get_vm_data()
         self._update_availability()
-        self.async_write_ha_state()
-    
-    def _get_vm_data(self) -> Optional[Dict[str, Any]]:
-        """Get current VM data from coordinator."""
-        for vm in self.coordinator.data.get("vms", []):
-            if str(vm["id"]) == str(self._vm_id):
-                return vm
-        return None
-    
-    def _update_availability(self) -> None:
-        """Update availability based on VM status."""
-        if not self._vm_data:
-            self._available = False
-            return
-        
-        # Restart button is only available when VM is running
-        self._available = self._vm_data.get("status") == STATUS_RUNNING
-    
-    def _action(self) -> None:
-        """Restart the VM."""
-        self._api.restart_vm(self._node_id, self._vm_id)
-
-
-class ProxmoxVMForceStopButton(ProxmoxButtonBase):
-    """Button to force stop a VM or container."""
-    
-    def __init__(
-        self,
-        coordinator: DataUpdateCoordinator,
-        api: ProxmoxAPI,
-        vm_id: str,
-        node_id: str,
-        entry_id: str,
-    ) -> None:
-        """Initialize the button."""
-        # Set up basic attributes and coordinator first
-        self.coordinator = coordinator
-        self._api = api
-        self._vm_id = vm_id
-        self._node_id = node_id
-        self._entry_id = entry_id
-        
-        # Set up parent classes
-        CoordinatorEntity.__init__(self, coordinator)
-        
-        # Set basic attributes
-        unique_id = f"{DOMAIN}_{entry_id}_vm_{vm_id}_force_stop"
-        self._attr_unique_id = unique_id
-        self._attr_name = "Force Stop"
-        self._attr_icon = "mdi:stop-circle"
-        self._device_type = CATEGORY_VM
-        self._device_id = f"vm_{vm_id}"
-        self._available = True
-        
-        # Now get VM data after coordinator is available
-        self._vm_data = self._get_vm_data()
-        
-        # Set device name based on VM data
-        self._device_name = self._vm_data.get("name", f"VM {vm_id}") if self._vm_data else f"VM {vm_id}"
-        self._via_device = (DOMAIN, f"node_{node_id}")
-        
-        # Update availability based on VM state
-        self._update_availability()
     
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self._vm_data = self._get_vm_data()
-        self._update_availability()
-        self.async_write_ha_state()
-    
-    def _get_vm_data(self) -> Optional[Dict[str, Any]]:
-        """Get current VM data from coordinator."""
-        for vm in self.coordinator.data.get("vms", []):
-            if str(vm["id"]) == str(self._vm_id):
-                return vm
-        return None
-    
-    def _update_availability(self) -> None:
-        """Update availability based on VM status."""
-        if not self._vm_data:
-            self._available = False
+        if vm_unchanged(self.coordinator, self._vm_id):
             return
-        
-        # Force stop button is only available when VM is running
-        self._available = self._vm_data.get("status") == STATUS_RUNNING
-    
-    def _action(self) -> None:
-        """Force stop the VM."""
-        self._api.force_stop_vm(self._node_id, self._vm_id)
-
-
-class ProxmoxVMForceRestartButton(ProxmoxButtonBase):
-    """Button to force restart a VM or container."""
+        super()._handle_coordinator_update()
     
-    def __init__(
-        self,
-        coordinator: DataUpdateCoordinator,
-        api: ProxmoxAPI,
-        vm_id: str,
-        node_id: str,
-        entry_id: str,
-    ) -> None:
-        """Initialize the button."""
-        # Set up basic attributes and coordinator first
-        self.coordinator = coordinator
-        self._api = api
-        self._vm_id = vm_id
-        self._node_id = node_id
-        self._entry_id = entry_id
-        
-        # Set up parent classes
-        CoordinatorEntity.__init__(self, coordinator)
-        
-        # Set basic attributes
-        unique_id = f"{DOMAIN}_{entry_id}_vm_{vm_id}_force_restart"
-        self._attr_unique_id = unique_id
-        self._attr_name = "Force Restart"
-        self._attr_icon = "mdi:restart-alert"
-        self._device_type = CATEGORY_VM
-        self._device_id = f"vm_{vm_id}"
-        self._available = True
-        
-        # Now get VM data after coordinator is available
+    def _update_data(self) -> None:
+        """Fetch the VM's row and update availability."""
         self._vm_data = self._get_vm_data()
-        
-        # Set device name based on VM data
-        self._device_name = self._vm_data.get("name", f"VM {vm_id}") if self._vm_data else f"VM {vm_id}"
-        self._via_device = (DOMAIN, f"node_{node_id}")
-        
-        # Update availability based on VM state
         self._update_availability()
     
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._vm_data = self._get_vm_data()
-        self._update_availability()
-        self.async_write_ha_state()
+    @property
+    def _vm_type(self) -> Optional[str]:
+        """Return the guest type from coordinator data, if known."""
+        return self._vm_data["type"] if self._vm_data else None
     
     def _get_vm_data(self) -> Optional[Dict[str, Any]]:
         """Get current VM data from coordinator."""
-        for vm in self.coordinator.data.get("vms", []):
-            if str(vm["id"]) == str(self._vm_id):
-                return vm
-        return None
+        return self.coordinator.data["vms_by_id"].get(self._vm_id)
     
     def _update_availability(self) -> None:
         """Update availability based on VM status."""
@@ -481,16 +257,17 @@ class ProxmoxVMForceRestartButton(ProxmoxButtonBase):
             self._available = False
             return
         
-        # Force restart button is available regardless of status
-        self._available = True
+        self._available = self._vm_action.available(self._vm_data)
     
     def _action(self) -> None:
-        """Force restart the VM."""
-        self._api.force_restart_vm(self._node_id, self._vm_id)
+        """Run the action on the VM."""
+        getattr(self._api, self._vm_action.api_method)(
+            self._node_id, self._vm_id, self._vm_type
+        )
 
 
-class ProxmoxNodeShutdownButton(ProxmoxButtonBase):
-    """Button to shutdown a Proxmox node."""
+class ProxmoxNodeActionButton(ProxmoxButtonBase):
+    """Button to run a power action on a Proxmox node."""
     
     def __init__(
         self,
@@ -498,114 +275,36 @@ class ProxmoxNodeShutdownButton(ProxmoxButtonBase):
         api: ProxmoxAPI,
         node_id: str,
         entry_id: str,
+        action: NodeAction,
+        unique_id_prefix: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the button."""
-        # Set up basic attributes and coordinator first
-        self.coordinator = coordinator
-        self._api = api
         self._node_id = node_id
         self._entry_id = entry_id
-        
-        # Set up parent classes
-        CoordinatorEntity.__init__(self, coordinator)
-        
-        # Set basic attributes
-        unique_id = f"{DOMAIN}_{entry_id}_node_{node_id}_shutdown"
-        self._attr_unique_id = unique_id
-        self._attr_name = "Shutdown"
-        self._attr_icon = "mdi:power"
-        self._device_type = CATEGORY_NODE
-        self._device_id = f"node_{node_id}"
-        self._available = True
-        
-        # Now get node data after coordinator is available
-        self._node_data = self._get_node_data()
-        
-        # Set device name based on node data
-        self._device_name = self._node_data.get("name", f"Node {node_id}") if self._node_data else f"Node {node_id}"
+        self._node_action = action
+        
+        super().__init__(
+            coordinator,
+            api,
+            unique_id_prefix + action.key,
+            action.name,
+            action.icon,
+            device_info,
+        )
         
         # Update availability based on node state
-        self._update_availability()
-    
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._node_data = self._get_node_data()
-        self._update_availability()
-        self.async_write_ha_state()
-    
-    def _get_node_data(self) -> Optional[Dict[str, Any]]:
-        """Get current node data from coordinator."""
-        for node in self.coordinator.data.get("nodes", []):
-            if node["id"] == self._node_id:
-                return node
-        return None
-    
-    def _update_availability(self) -> None:
-        """Update availability based on node status."""
-        if not self._node_data:
-            self._available = False
-            return
-        
-        # Node shutdown button is only available when node is online
-        self._available = self._node_data.get("status") == "online"
-    
-    def _action(self) -> None:
-        """Shutdown the node."""
-        self._api.shutdown_node(self._node_id)
-
-
-class ProxmoxNodeRestartButton(ProxmoxButtonBase):
-    """Button to restart a Proxmox node."""
-    
-    def __init__(
-        self,
-        coordinator: DataUpdateCoordinator,
-        api: ProxmoxAPI,
-        node_id: str,
-        entry_id: str,
-    ) -> None:
-        """Initialize the button."""
-        # Set up basic attributes and coordinator first
-        self.coordinator = coordinator
-        self._api = api
-        self._node_id = node_id
-        self._entry_id = entry_id
-        
-        # Set up parent classes
-        CoordinatorEntity.__init__(self, coordinator)
-        
-        # Set basic attributes
-        unique_id = f"{DOMAIN}_{entry_id}_node_{node_id}_restart"
-        self._attr_unique_id = unique_id
-        self._attr_name = "Restart"
-        self._attr_icon = "mdi:restart"
-        self._device_type = CATEGORY_NODE
-        self._device_id = f"node_{node_id}"
-        self._available = True
-        
-        # Now get node data after coordinator is available
         self._node_data = self._get_node_data()
-        
-        # Set device name based on node data
-        self._device_name = self._node_data.get("name", f"Node {node_id}") if self._node_data else f"Node {node_id}"
-        
-        # Update availability based on node state
         self._update_availability()
     
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
+    def _update_data(self) -> None:
+        """Fetch the node's row and update availability."""
         self._node_data = self._get_node_data()
         self._update_availability()
-        self.async_write_ha_state()
     
     def _get_node_data(self) -> Optional[Dict[str, Any]]:
         """Get current node data from coordinator."""
-        for node in self.coordinator.data.get("nodes", []):
-            if node["id"] == self._node_id:
-                return node
-        return None
+        return self.coordinator.data["nodes_by_id"].get(self._node_id)
     
     def _update_availability(self) -> None:
         """Update availability based on node status."""
@@ -613,9 +312,9 @@ class ProxmoxNodeRestartButton(ProxmoxButtonBase):
             self._available = False
             return
         
-        # Node restart button is only available when node is online
-        self._available = self._node_data.get("status") == "online"
+        # Node actions are only available when the node is online
+        self._available = self._node_data["is_online"]
     
     def _action(self) -> None:
-        """Restart the node."""
-        self._api.restart_node(self._node_id)
+        """Run the action on the node."""
+        getattr(self._api, self._node_action.api_method)(self._node_id)
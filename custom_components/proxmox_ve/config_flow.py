@@ -1,4 +1,5 @@
 """Config flow for Proxmox VE integration."""
+import asyncio
 import logging
 from typing import Any, Dict, Optional
 
@@ -19,14 +20,19 @@ import homeassistant.helpers.config_validation as cv
 from .api import ProxmoxAPI
 from .const import (
     CONF_REALM,
+    CONF_VM_FILTER,
     DEFAULT_PORT,
     DEFAULT_REALM,
     DEFAULT_VERIFY_SSL,
+    DEFAULT_VM_FILTER,
     DOMAIN,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Upper bound on the whole login and probe, so the form never hangs
+CONNECT_TIMEOUT = 10  # seconds
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_HOST): cv.string,
@@ -57,12 +63,17 @@ async def validate_input(hass: HomeAssistant, data: Dict[str, Any]) -> Dict[str,
     try:
         # Use async_add_executor_job to run blocking call in an executor
         # The test_connection method will handle connecting to the API
-        result = await hass.async_add_executor_job(api.test_connection)
+        result = await asyncio.wait_for(
+            hass.async_add_executor_job(api.test_connection), CONNECT_TIMEOUT
+        )
         if not result:
             raise CannotConnect
     except Exception as e:
         _LOGGER.error("Failed to connect to Proxmox VE server: %s", e)
         raise CannotConnect from e
+    finally:
+        # The client was only needed for this check
+        await hass.async_add_executor_job(api.close)
 
     # Return info that you want to store in the config entry.
     return {"title": f"Proxmox VE ({data[CONF_HOST]})"}
@@ -113,6 +124,22 @@ class ProxmoxVEOptionsFlow(config_entries.OptionsFlow):
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         """Initialize options flow."""
         self.config_entry = config_entry
+        # The defaults only depend on the entry, so build the form schema once
+        self._options_schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_VERIFY_SSL,
+                    default=config_entry.options.get(
+                        CONF_VERIFY_SSL,
+                        config_entry.data.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL),
+                    ),
+                ): cv.boolean,
+                vol.Optional(
+                    CONF_VM_FILTER,
+                    default=config_entry.options.get(CONF_VM_FILTER, DEFAULT_VM_FILTER),
+                ): cv.string,
+            }
+        )
 
     async def async_step_init(
         self, user_input: Optional[Dict[str, Any]] = None
@@ -121,17 +148,7 @@ class ProxmoxVEOptionsFlow(config_entries.OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
-        options = {
-            vol.Optional(
-                CONF_VERIFY_SSL,
-                default=self.config_entry.options.get(
-                    CONF_VERIFY_SSL,
-                    self.config_entry.data.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL),
-                ),
-            ): cv.boolean,
-        }
-
-        return self.async_show_form(step_id="init", data_schema=vol.Schema(options))
+        return self.async_show_form(step_id="init", data_schema=self._options_schema)
 
 
 class CannotConnect(HomeAssistantError):
@@ -3,6 +3,9 @@
 DOMAIN = "proxmox_ve"
 PLATFORMS = ["device_tracker", "binary_sensor", "sensor", "switch", "button"]
 UPDATE_INTERVAL = 30  # seconds
+# Node and storage usage moves more slowly than guest state
+NODE_UPDATE_INTERVAL = 60  # seconds
+STORAGE_UPDATE_INTERVAL = 300  # seconds
 
 # Configuration
 CONF_HOST = "host"
@@ -11,11 +14,13 @@ CONF_USERNAME = "username"
 CONF_PASSWORD = "password"
 CONF_REALM = "realm"
 CONF_VERIFY_SSL = "verify_ssl"
+CONF_VM_FILTER = "vm_filter"
 
 # Default values
 DEFAULT_PORT = 8006
 DEFAULT_REALM = "pam"
 DEFAULT_VERIFY_SSL = True
+DEFAULT_VM_FILTER = ""
 
 # Entity attributes
 ATTR_STATUS = "status"
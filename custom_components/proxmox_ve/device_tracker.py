@@ -13,7 +13,8 @@ from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
 )
 
-from .const import DOMAIN, CATEGORY_VM, STATUS_RUNNING
+from .const import DOMAIN, CATEGORY_VM
+from .entity import vm_unchanged
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,12 +25,12 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Proxmox VE device trackers."""
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]["vm_coordinator"]
     
     entities = []
     
     # Add VM trackers
-    for vm in coordinator.data.get("vms", []):
+    for vm in coordinator.data["vms"]:
         entities.append(ProxmoxVMTracker(coordinator, vm["id"], config_entry.entry_id))
     
     async_add_entities(entities)
@@ -38,30 +39,38 @@ async def async_setup_entry(
 class ProxmoxVMTracker(CoordinatorEntity, ScannerEntity):
     """Representation of a Proxmox VM tracker."""
 
+    # (available, VM row) as of the last state write
+    _last_written: Optional[tuple] = None
+
     def __init__(
-        self, coordinator: DataUpdateCoordinator, vm_id: str, entry_id: str
+        self, coordinator: DataUpdateCoordinator, vm_id: int, entry_id: str
     ) -> None:
         """Initialize the VM tracker."""
-        # Explicitly initialize the CoordinatorEntity parent class
-        CoordinatorEntity.__init__(self, coordinator)
-        self.coordinator = coordinator
-        self._vm_id = vm_id
+        super().__init__(coordinator)
+        self._vm_id = int(vm_id)
         self._entry_id = entry_id
         self._attr_unique_id = f"{DOMAIN}_{entry_id}_vm_{vm_id}_tracker"
+        self._device_identifiers = {(DOMAIN, f"vm_{vm_id}")}
+        self._fallback_name = f"VM {vm_id}"
         self._vm_data = self._get_vm_data()
     
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        if vm_unchanged(self.coordinator, self._vm_id):
+            return
         self._vm_data = self._get_vm_data()
+        # Name, state and attributes all derive from this row; availability
+        # follows the coordinator's last update
+        written = (self.available, self._vm_data)
+        if written == self._last_written:
+            return
+        self._last_written = written
         self.async_write_ha_state()
 
     def _get_vm_data(self) -> Optional[Dict[str, Any]]:
         """Get current VM data from coordinator."""
-        for vm in self.coordinator.data.get("vms", []):
-            if str(vm["id"]) == str(self._vm_id):
-                return vm
-        return None
+        return self.coordinator.data["vms_by_id"].get(self._vm_id)
 
     @property
     def source_type(self) -> str:
@@ -72,15 +81,15 @@ class ProxmoxVMTracker(CoordinatorEntity, ScannerEntity):
     def name(self) -> str:
         """Return the name of the device."""
         if self._vm_data and self._vm_data.get("name"):
-            return f"{self._vm_data['name']}"
-        return f"VM {self._vm_id}"
+            return self._vm_data["name"]
+        return self._fallback_name
 
     @property
     def is_connected(self) -> bool:
         """Return true if the device is connected."""
         if not self._vm_data:
             return False
-        return self._vm_data.get("status") == STATUS_RUNNING
+        return self._vm_data["is_running"]
 
     @property
     def icon(self) -> str:
@@ -121,10 +130,14 @@ class ProxmoxVMTracker(CoordinatorEntity, ScannerEntity):
     @property
     def device_info(self) -> DeviceInfo:
         """Return device registry information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"vm_{self._vm_id}")},
+        device_info = DeviceInfo(
+            identifiers=self._device_identifiers,
             name=self.name,
             manufacturer="Proxmox VE",
             model="Virtual Machine",
-            via_device=(DOMAIN, f"node_{self._vm_data.get('node')}" if self._vm_data else None),
         )
+        # Without data the parent node is unknown, so leave via_device out
+        # rather than pointing it at a non-existent device
+        if self._vm_data:
+            device_info["via_device"] = (DOMAIN, f"node_{self._vm_data['node']}")
+        return device_info
@@ -0,0 +1,14 @@
+"""Helpers shared by the Proxmox VE entity platforms."""
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+
+def vm_unchanged(coordinator: DataUpdateCoordinator, vm_id: int) -> bool:
+    """Return True if the last refresh left a VM's row untouched.
+
+    Entities of that VM have nothing new to show and can skip the update.
+    After a failed refresh every entity updates, to follow availability.
+    """
+    return (
+        coordinator.last_update_success
+        and vm_id not in coordinator.data["changed_vms"]
+    )
@@ -1,9 +1,9 @@
 """Sensors for Proxmox VE."""
 import logging
-from typing import Any, Dict, Optional, Union, cast
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterator, NamedTuple, Optional, Union
 
 from homeassistant.components.sensor import (
-    SensorDeviceClass,
     SensorEntity,
     SensorStateClass,
 )
@@ -27,411 +27,291 @@ from .const import (
     CATEGORY_STORAGE,
     CATEGORY_VM,
 )
+from .entity import vm_unchanged
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class SensorDescription(NamedTuple):
+    """Static description of a per-VM or per-node sensor."""
+
+    key: str
+    name: str
+    # Coordinator row -> state; None makes the sensor unavailable
+    value: Callable[[Dict[str, Any]], Any]
+    # Coordinator row -> extra state attributes
+    attributes: Callable[[Dict[str, Any]], Dict[str, Any]]
+    device_class: Optional[str] = None
+    state_class: Optional[str] = None
+    unit: Optional[str] = None
+    entity_category: Optional[EntityCategory] = None
+    icon: Optional[str] = None
+
+
+def _cpu_attributes(vm: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the CPU sensor's attributes."""
+    return {"cores": vm["cpu"].get("total", 0)}
+
+
+def _memory_attributes(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the memory sensor's attributes."""
+    memory = row["memory"]
+    attrs = {"total_memory": memory.get("total", 0)}
+    if "percent" in memory:
+        attrs["memory_percent"] = memory["percent"]
+    return attrs
+
+
+def _disk_attributes(node: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the node disk sensor's attributes."""
+    disk = node["disk"]
+    if not disk:
+        return {}
+    attrs = {"total_space": disk.get("total", 0)}
+    if "percent" in disk:
+        attrs["disk_percent"] = disk["percent"]
+    return attrs
+
+
+def _no_attributes(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Return no attributes beyond the common ones."""
+    return {}
+
+
+VM_SENSORS = (
+    SensorDescription(
+        "cpu",
+        "CPU",
+        lambda vm: vm["cpu"]["percent"],
+        _cpu_attributes,
+        device_class="cpu",
+        state_class=SensorStateClass.MEASUREMENT,
+        unit=PERCENTAGE,
+    ),
+    SensorDescription(
+        "memory",
+        "Memory",
+        lambda vm: vm["memory"].get("used", 0),
+        _memory_attributes,
+        device_class="memory",
+        state_class=SensorStateClass.MEASUREMENT,
+        unit=UnitOfInformation.BYTES,
+    ),
+    SensorDescription(
+        "disk",
+        "Disk",
+        lambda vm: vm["disk"].get("total", 0),
+        _no_attributes,
+        device_class="data_size",
+        state_class=SensorStateClass.TOTAL,
+        unit=UnitOfInformation.BYTES,
+    ),
+)
+
+# Only created for guests that report an address
+VM_IP_SENSOR = SensorDescription(
+    "ip",
+    "IP",
+    lambda vm: vm.get("ip_address") or None,
+    _no_attributes,
+    entity_category=EntityCategory.DIAGNOSTIC,
+    icon="mdi:ip-network",
+)
+
+NODE_SENSORS = (
+    SensorDescription(
+        "cpu",
+        "CPU",
+        itemgetter("cpu_percent"),
+        _no_attributes,
+        device_class="cpu",
+        state_class=SensorStateClass.MEASUREMENT,
+        unit=PERCENTAGE,
+    ),
+    SensorDescription(
+        "memory",
+        "Memory",
+        lambda node: node["memory"].get("used", 0),
+        _memory_attributes,
+        device_class="memory",
+        state_class=SensorStateClass.MEASUREMENT,
+        unit=UnitOfInformation.BYTES,
+    ),
+    SensorDescription(
+        "disk",
+        "Disk",
+        # Nodes without a disk mounted at / have no disk usage
+        lambda node: node["disk"].get("used", 0) if node["disk"] else None,
+        _disk_attributes,
+        device_class="data_size",
+        state_class=SensorStateClass.MEASUREMENT,
+        unit=UnitOfInformation.BYTES,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Proxmox VE sensors."""
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+    data = hass.data[DOMAIN][config_entry.entry_id]
+    vm_coordinator = data["vm_coordinator"]
+    node_coordinator = data["node_coordinator"]
+    storage_coordinator = data["storage_coordinator"]
     
-    entities = []
+    entry_id = config_entry.entry_id
     
-    # Add VM sensors
-    for vm in coordinator.data.get("vms", []):
-        vm_id = vm["id"]
-        # CPU sensor
-        entities.append(
-            ProxmoxVMCpuSensor(coordinator, vm_id, config_entry.entry_id)
-        )
-        # Memory sensor
-        entities.append(
-            ProxmoxVMMemorySensor(coordinator, vm_id, config_entry.entry_id)
-        )
-        # Disk sensor
-        entities.append(
-            ProxmoxVMDiskSensor(coordinator, vm_id, config_entry.entry_id)
-        )
-        # IP Address sensor (if available)
-        if vm.get("ip_address"):
-            entities.append(
-                ProxmoxVMIpSensor(coordinator, vm_id, config_entry.entry_id)
+    def _iter_entities() -> Iterator[ProxmoxSensorBase]:
+        """Yield every sensor in one pass, without building a list first."""
+        # VM sensors: CPU, memory, disk and, if known, the IP address
+        for vm in vm_coordinator.data["vms"]:
+            vm_id = vm["id"]
+            for description in VM_SENSORS:
+                yield ProxmoxVMSensor(vm_coordinator, vm_id, entry_id, description)
+            if vm.get("ip_address"):
+                yield ProxmoxVMSensor(vm_coordinator, vm_id, entry_id, VM_IP_SENSOR)
+        
+        # Node sensors: CPU, memory and disk
+        for node in node_coordinator.data["nodes"]:
+            for description in NODE_SENSORS:
+                yield ProxmoxNodeSensor(
+                    node_coordinator, node["id"], entry_id, description
+                )
+        
+        # Storage sensors
+        for storage in storage_coordinator.data["storages"]:
+            yield ProxmoxStorageSensor(
+                storage_coordinator, storage["id"], storage["node"], entry_id
             )
     
-    # Add Node sensors
-    for node in coordinator.data.get("nodes", []):
-        node_id = node["id"]
-        # CPU sensor
-        entities.append(
-            ProxmoxNodeCpuSensor(coordinator, node_id, config_entry.entry_id)
-        )
-        # Memory sensor
-        entities.append(
-            ProxmoxNodeMemorySensor(coordinator, node_id, config_entry.entry_id)
-        )
-        # Disk sensor
-        entities.append(
-            ProxmoxNodeDiskSensor(coordinator, node_id, config_entry.entry_id)
-        )
-    
-    # Add Storage sensors
-    for storage in coordinator.data.get("storages", []):
-        storage_id = storage["id"]
-        node_id = storage["node"]
-        entities.append(
-            ProxmoxStorageSensor(coordinator, storage_id, node_id, config_entry.entry_id)
-        )
-    
-    async_add_entities(entities)
+    async_add_entities(_iter_entities())
 
 
 class ProxmoxSensorBase(CoordinatorEntity, SensorEntity):
     """Base class for Proxmox VE sensors."""
 
+    # Everything that goes into the state, as of the last state write
+    _last_written: Optional[tuple] = None
+    _cached_attrs: Optional[Dict[str, Any]] = None
+    _cached_device_info: Optional[DeviceInfo] = None
+
     def __init__(
         self, coordinator: DataUpdateCoordinator, unique_id: str, name: str
     ) -> None:
         """Initialize the sensor."""
-        # Explicitly initialize the CoordinatorEntity parent class
-        CoordinatorEntity.__init__(self, coordinator)
-        self.coordinator = coordinator
+        super().__init__(coordinator)
         self._attr_unique_id = unique_id
         self._attr_name = name
         self._state: Any = None
         self._available = True
 
-
-class ProxmoxVMCpuSensor(ProxmoxSensorBase):
-    """Sensor for Proxmox VM CPU usage."""
-
-    _attr_device_class = "cpu"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = PERCENTAGE
-    
-    def __init__(
-        self, coordinator: DataUpdateCoordinator, vm_id: str, entry_id: str
-    ) -> None:
-        """Initialize the sensor."""
-        # First set up the coordinator and basic attributes before anything else
-        self.coordinator = coordinator
-        self._vm_id = vm_id
-        self._entry_id = entry_id
-        
-        # Set name based on vm_id initially, then get VM data
-        unique_id = f"{DOMAIN}_{entry_id}_vm_{vm_id}_cpu"
-        name = f"VM {vm_id} CPU"
-        
-        # Initialize parent classes
-        # Explicitly initialize coordinator to prevent attribute error
-        CoordinatorEntity.__init__(self, coordinator)
-        SensorEntity.__init__(self)
-        
-        # Only now get VM data after coordinator is available
-        self._vm_data = self._get_vm_data()
-        
-        # Update name if we have VM data
-        if self._vm_data and self._vm_data.get("name"):
-            self._attr_name = f"{self._vm_data['name']} CPU"
-        else:
-            self._attr_name = name
-            
-        self._attr_unique_id = unique_id
-        self._update_state()
-    
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._vm_data = self._get_vm_data()
-        self._update_state()
-        self.async_write_ha_state()
-
-    def _get_vm_data(self) -> Optional[Dict[str, Any]]:
-        """Get current VM data from coordinator."""
-        for vm in self.coordinator.data.get("vms", []):
-            if str(vm["id"]) == str(self._vm_id):
-                return vm
-        return None
-
-    def _update_state(self) -> None:
-        """Update the state from the data."""
-        if not self._vm_data or not self._vm_data.get("cpu"):
-            self._available = False
-            return
-        
-        cpu_data = self._vm_data["cpu"]
-        self._state = round(cpu_data.get("used", 0) * 100, 2)
-        self._available = True
-
-    @property
-    def native_value(self) -> Optional[float]:
-        """Return the state of the sensor."""
-        if not self._available:
-            return None
-        return self._state
-
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return extra state attributes."""
-        attrs = {
-            "device_type": CATEGORY_VM,
-            "vm_id": self._vm_id,
-        }
-        
-        if self._vm_data and self._vm_data.get("cpu"):
-            attrs["cores"] = self._vm_data["cpu"].get("total", 0)
-        
-        return attrs
+        """Return extra state attributes, built once per data update."""
+        if self._cached_attrs is None:
+            self._cached_attrs = self._build_attributes()
+        return self._cached_attrs
 
     @property
-    def device_info(self) -> DeviceInfo:
-        """Return device registry information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"vm_{self._vm_id}")},
-            name=self._vm_data.get("name", f"VM {self._vm_id}") if self._vm_data else f"VM {self._vm_id}",
-            manufacturer="Proxmox VE",
-            model="Virtual Machine",
-            via_device=(DOMAIN, f"node_{self._vm_data.get('node')}" if self._vm_data else None),
-        )
-
-
-class ProxmoxVMMemorySensor(ProxmoxSensorBase):
-    """Sensor for Proxmox VM memory usage."""
-
-    _attr_device_class = "memory"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfInformation.BYTES
-    
-    def __init__(
-        self, coordinator: DataUpdateCoordinator, vm_id: str, entry_id: str
-    ) -> None:
-        """Initialize the sensor."""
-        # First set up the coordinator and basic attributes before anything else
-        self.coordinator = coordinator
-        self._vm_id = vm_id
-        self._entry_id = entry_id
-        
-        # Set name based on vm_id initially, then get VM data
-        unique_id = f"{DOMAIN}_{entry_id}_vm_{vm_id}_memory"
-        name = f"VM {vm_id} Memory"
-        
-        # Initialize parent classes
-        # Explicitly initialize coordinator to prevent attribute error
-        CoordinatorEntity.__init__(self, coordinator)
-        SensorEntity.__init__(self)
-        
-        # Only now get VM data after coordinator is available
-        self._vm_data = self._get_vm_data()
-        
-        # Update name if we have VM data
-        if self._vm_data and self._vm_data.get("name"):
-            self._attr_name = f"{self._vm_data['name']} Memory"
-        else:
-            self._attr_name = name
-            
-        self._attr_unique_id = unique_id
-        self._update_state()
-    
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._vm_data = self._get_vm_data()
-        self._update_state()
-        self.async_write_ha_state()
-
-    def _get_vm_data(self) -> Optional[Dict[str, Any]]:
-        """Get current VM data from coordinator."""
-        for vm in self.coordinator.data.get("vms", []):
-            if str(vm["id"]) == str(self._vm_id):
-                return vm
+    def device_info(self) -> Optional[DeviceInfo]:
+        """Return device registry information, built once per data update."""
+        if self._cached_device_info is None:
+            self._cached_device_info = self._build_device_info()
+        return self._cached_device_info
+
+    def _build_attributes(self) -> Dict[str, Any]:
+        """Build extra state attributes from the current data."""
+        return {}
+
+    def _build_device_info(self) -> Optional[DeviceInfo]:
+        """Build device registry information from the current data."""
         return None
 
-    def _update_state(self) -> None:
-        """Update the state from the data."""
-        if not self._vm_data or not self._vm_data.get("memory"):
-            self._available = False
-            return
-        
-        memory_data = self._vm_data["memory"]
-        self._state = memory_data.get("used", 0)
-        self._available = True
-
-    @property
-    def native_value(self) -> Optional[int]:
-        """Return the state of the sensor."""
-        if not self._available:
-            return None
-        return self._state
-
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return extra state attributes."""
-        attrs = {
-            "device_type": CATEGORY_VM,
-            "vm_id": self._vm_id,
-        }
-        
-        if self._vm_data and self._vm_data.get("memory"):
-            attrs["total_memory"] = self._vm_data["memory"].get("total", 0)
-            if self._state is not None and self._vm_data["memory"].get("total", 0) > 0:
-                attrs["memory_percent"] = round(
-                    self._state / self._vm_data["memory"].get("total", 1) * 100, 2
-                )
-        
-        return attrs
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device registry information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"vm_{self._vm_id}")},
-            name=self._vm_data.get("name", f"VM {self._vm_id}") if self._vm_data else f"VM {self._vm_id}",
+    def _vm_device_info(self) -> DeviceInfo:
+        """Build device registry information for a VM sensor."""
+        device_info = DeviceInfo(
+            identifiers=self._device_identifiers,
+            name=(
+                self._vm_data.get("name", self._fallback_name)
+                if self._vm_data
+                else self._fallback_name
+            ),
             manufacturer="Proxmox VE",
             model="Virtual Machine",
-            via_device=(DOMAIN, f"node_{self._vm_data.get('node')}" if self._vm_data else None),
         )
+        if self._vm_data:
+            device_info["via_device"] = (DOMAIN, f"node_{self._vm_data['node']}")
+        return device_info
 
+    def _invalidate_cache(self) -> None:
+        """Drop attributes and device info derived from the previous data."""
+        self._cached_attrs = None
+        self._cached_device_info = None
 
-class ProxmoxVMDiskSensor(ProxmoxSensorBase):
-    """Sensor for Proxmox VM disk usage."""
-
-    _attr_device_class = "data_size"
-    _attr_state_class = SensorStateClass.TOTAL
-    _attr_native_unit_of_measurement = UnitOfInformation.BYTES
-    
-    def __init__(
-        self, coordinator: DataUpdateCoordinator, vm_id: str, entry_id: str
-    ) -> None:
-        """Initialize the sensor."""
-        # First set up the coordinator and basic attributes before anything else
-        self.coordinator = coordinator
-        self._vm_id = vm_id
-        self._entry_id = entry_id
-        
-        # Set name based on vm_id initially, then get VM data
-        unique_id = f"{DOMAIN}_{entry_id}_vm_{vm_id}_disk"
-        name = f"VM {vm_id} Disk"
-        
-        # Initialize parent classes
-        # Explicitly initialize coordinator to prevent attribute error
-        CoordinatorEntity.__init__(self, coordinator)
-        SensorEntity.__init__(self)
-        
-        # Only now get VM data after coordinator is available
-        self._vm_data = self._get_vm_data()
-        
-        # Update name if we have VM data
-        if self._vm_data and self._vm_data.get("name"):
-            self._attr_name = f"{self._vm_data['name']} Disk"
-        else:
-            self._attr_name = name
-            
-        self._attr_unique_id = unique_id
-        self._update_state()
-    
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._vm_data = self._get_vm_data()
-        self._update_state()
-        self.async_write_ha_state()
-
-    def _get_vm_data(self) -> Optional[Dict[str, Any]]:
-        """Get current VM data from coordinator."""
-        for vm in self.coordinator.data.get("vms", []):
-            if str(vm["id"]) == str(self._vm_id):
-                return vm
-        return None
-
-    def _update_state(self) -> None:
-        """Update the state from the data."""
-        if not self._vm_data or not self._vm_data.get("disk"):
-            self._available = False
-            return
-        
-        disk_data = self._vm_data["disk"]
-        self._state = disk_data.get("total", 0)
-        self._available = True
-
-    @property
-    def native_value(self) -> Optional[int]:
-        """Return the state of the sensor."""
-        if not self._available:
-            return None
-        return self._state
-
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return extra state attributes."""
-        return {
-            "device_type": CATEGORY_VM,
-            "vm_id": self._vm_id,
-        }
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device registry information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"vm_{self._vm_id}")},
-            name=self._vm_data.get("name", f"VM {self._vm_id}") if self._vm_data else f"VM {self._vm_id}",
-            manufacturer="Proxmox VE",
-            model="Virtual Machine",
-            via_device=(DOMAIN, f"node_{self._vm_data.get('node')}" if self._vm_data else None),
+    def _async_write_if_changed(self) -> None:
+        """Write state only if anything the sensor exposes has changed."""
+        written = (
+            self.available, self._available, self._state, self.extra_state_attributes
         )
+        if written == self._last_written:
+            return
+        self._last_written = written
+        self.async_write_ha_state()
 
 
-class ProxmoxVMIpSensor(ProxmoxSensorBase):
-    """Sensor for Proxmox VM IP address."""
+class ProxmoxVMSensor(ProxmoxSensorBase):
+    """Sensor for one value of a Proxmox VM, as given by its description."""
 
-    _attr_device_class = None
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    
     def __init__(
-        self, coordinator: DataUpdateCoordinator, vm_id: str, entry_id: str
+        self,
+        coordinator: DataUpdateCoordinator,
+        vm_id: int,
+        entry_id: str,
+        description: SensorDescription,
     ) -> None:
         """Initialize the sensor."""
-        # First set up the coordinator and basic attributes before anything else
-        self.coordinator = coordinator
-        self._vm_id = vm_id
+        self._vm_id = int(vm_id)
         self._entry_id = entry_id
+        self._description = description
+        self._device_identifiers = {(DOMAIN, f"vm_{vm_id}")}
+        self._fallback_name = f"VM {vm_id}"
         
         # Set name based on vm_id initially, then get VM data
-        unique_id = f"{DOMAIN}_{entry_id}_vm_{vm_id}_ip"
-        name = f"VM {vm_id} IP"
+        unique_id = f"{DOMAIN}_{entry_id}_vm_{vm_id}_{description.key}"
+        name = f"VM {vm_id} {description.name}"
         
-        # Initialize parent classes
-        # Explicitly initialize coordinator to prevent attribute error
-        CoordinatorEntity.__init__(self, coordinator)
-        SensorEntity.__init__(self)
+        super().__init__(coordinator, unique_id, name)
+        self._attr_device_class = description.device_class
+        self._attr_state_class = description.state_class
+        self._attr_native_unit_of_measurement = description.unit
+        self._attr_entity_category = description.entity_category
+        self._attr_icon = description.icon
         
-        # Only now get VM data after coordinator is available
+        # Get VM data now that the coordinator is set
         self._vm_data = self._get_vm_data()
         
         # Update name if we have VM data
         if self._vm_data and self._vm_data.get("name"):
-            self._attr_name = f"{self._vm_data['name']} IP"
-        else:
-            self._attr_name = name
-            
-        self._attr_unique_id = unique_id
+            self._attr_name = f"{self._vm_data['name']} {description.name}"
+        
         self._update_state()
     
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        if vm_unchanged(self.coordinator, self._vm_id):
+            return
         self._vm_data = self._get_vm_data()
         self._update_state()
-        self.async_write_ha_state()
+        self._invalidate_cache()
+        self._async_write_if_changed()
 
     def _get_vm_data(self) -> Optional[Dict[str, Any]]:
         """Get current VM data from coordinator."""
-        for vm in self.coordinator.data.get("vms", []):
-            if str(vm["id"]) == str(self._vm_id):
-                return vm
-        return None
+        return self.coordinator.data["vms_by_id"].get(self._vm_id)
 
     def _update_state(self) -> None:
         """Update the state from the data."""
@@ -439,258 +319,64 @@ class ProxmoxVMIpSensor(ProxmoxSensorBase):
             self._available = False
             return
         
-        self._state = self._vm_data.get("ip_address")
-        self._available = bool(self._state)
+        self._state = self._description.value(self._vm_data)
+        self._available = self._state is not None
 
     @property
-    def native_value(self) -> Optional[str]:
+    def native_value(self) -> Optional[Union[float, int, str]]:
         """Return the state of the sensor."""
         if not self._available:
             return None
         return self._state
 
-    @property
-    def icon(self) -> str:
-        """Return the icon of the sensor."""
-        return "mdi:ip-network"
-
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return extra state attributes."""
-        return {
+    def _build_attributes(self) -> Dict[str, Any]:
+        """Build extra state attributes from the current data."""
+        attrs = {
             "device_type": CATEGORY_VM,
             "vm_id": self._vm_id,
         }
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device registry information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"vm_{self._vm_id}")},
-            name=self._vm_data.get("name", f"VM {self._vm_id}") if self._vm_data else f"VM {self._vm_id}",
-            manufacturer="Proxmox VE",
-            model="Virtual Machine",
-            via_device=(DOMAIN, f"node_{self._vm_data.get('node')}" if self._vm_data else None),
-        )
-
-
-class ProxmoxNodeCpuSensor(ProxmoxSensorBase):
-    """Sensor for Proxmox Node CPU usage."""
-
-    _attr_device_class = "cpu"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = PERCENTAGE
-    
-    def __init__(
-        self, coordinator: DataUpdateCoordinator, node_id: str, entry_id: str
-    ) -> None:
-        """Initialize the sensor."""
-        # First set up the coordinator and basic attributes before anything else
-        self.coordinator = coordinator
-        self._node_id = node_id
-        self._entry_id = entry_id
-        
-        # Set name based on node_id initially, then get Node data
-        unique_id = f"{DOMAIN}_{entry_id}_node_{node_id}_cpu"
-        name = f"Node {node_id} CPU"
-        
-        # Initialize parent classes
-        # Explicitly initialize coordinator to prevent attribute error
-        CoordinatorEntity.__init__(self, coordinator)
-        SensorEntity.__init__(self)
-        
-        # Only now get node data after coordinator is available
-        self._node_data = self._get_node_data()
-        
-        # Update name if we have node data
-        if self._node_data and self._node_data.get("name"):
-            self._attr_name = f"{self._node_data['name']} CPU"
-        else:
-            self._attr_name = name
-            
-        self._attr_unique_id = unique_id
-        self._update_state()
-    
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._node_data = self._get_node_data()
-        self._update_state()
-        self.async_write_ha_state()
-
-    def _get_node_data(self) -> Optional[Dict[str, Any]]:
-        """Get current node data from coordinator."""
-        for node in self.coordinator.data.get("nodes", []):
-            if node["id"] == self._node_id:
-                return node
-        return None
-
-    def _update_state(self) -> None:
-        """Update the state from the data."""
-        if not self._node_data:
-            self._available = False
-            return
-        
-        self._state = round(self._node_data.get("cpu", 0) * 100, 2)
-        self._available = True
-
-    @property
-    def native_value(self) -> Optional[float]:
-        """Return the state of the sensor."""
-        if not self._available:
-            return None
-        return self._state
-
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return extra state attributes."""
-        return {
-            "device_type": CATEGORY_NODE,
-            "node_id": self._node_id,
-        }
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device registry information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"node_{self._node_id}")},
-            name=self._node_data.get("name", f"Node {self._node_id}") if self._node_data else f"Node {self._node_id}",
-            manufacturer="Proxmox VE",
-            model="Node",
-        )
-
-
-class ProxmoxNodeMemorySensor(ProxmoxSensorBase):
-    """Sensor for Proxmox Node memory usage."""
-
-    _attr_device_class = "memory"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfInformation.BYTES
-    
-    def __init__(
-        self, coordinator: DataUpdateCoordinator, node_id: str, entry_id: str
-    ) -> None:
-        """Initialize the sensor."""
-        # First set up the coordinator and basic attributes before anything else
-        self.coordinator = coordinator
-        self._node_id = node_id
-        self._entry_id = entry_id
-        
-        # Set name based on node_id initially, then get Node data
-        unique_id = f"{DOMAIN}_{entry_id}_node_{node_id}_memory"
-        name = f"Node {node_id} Memory"
-        
-        # Initialize parent classes
-        # Explicitly initialize coordinator to prevent attribute error
-        CoordinatorEntity.__init__(self, coordinator)
-        SensorEntity.__init__(self)
-        
-        # Only now get node data after coordinator is available
-        self._node_data = self._get_node_data()
-        
-        # Update name if we have node data
-        if self._node_data and self._node_data.get("name"):
-            self._attr_name = f"{self._node_data['name']} Memory"
-        else:
-            self._attr_name = name
-            
-        self._attr_unique_id = unique_id
-        self._update_state()
-    
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._node_data = self._get_node_data()
-        self._update_state()
-        self.async_write_ha_state()
-
-    def _get_node_data(self) -> Optional[Dict[str, Any]]:
-        """Get current node data from coordinator."""
-        for node in self.coordinator.data.get("nodes", []):
-            if node["id"] == self._node_id:
-                return node
-        return None
-
-    def _update_state(self) -> None:
-        """Update the state from the data."""
-        if not self._node_data or not self._node_data.get("memory"):
-            self._available = False
-            return
-        
-        memory_data = self._node_data["memory"]
-        self._state = memory_data.get("used", 0)
-        self._available = True
-
-    @property
-    def native_value(self) -> Optional[int]:
-        """Return the state of the sensor."""
-        if not self._available:
-            return None
-        return self._state
-
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return extra state attributes."""
-        attrs = {
-            "device_type": CATEGORY_NODE,
-            "node_id": self._node_id,
-        }
-        
-        if self._node_data and self._node_data.get("memory"):
-            attrs["total_memory"] = self._node_data["memory"].get("total", 0)
-            if self._state is not None and self._node_data["memory"].get("total", 0) > 0:
-                attrs["memory_percent"] = round(
-                    self._state / self._node_data["memory"].get("total", 1) * 100, 2
-                )
-        
+        if self._vm_data:
+            attrs.update(self._description.attributes(self._vm_data))
         return attrs
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device registry information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"node_{self._node_id}")},
-            name=self._node_data.get("name", f"Node {self._node_id}") if self._node_data else f"Node {self._node_id}",
-            manufacturer="Proxmox VE",
-            model="Node",
-        )
+    def _build_device_info(self) -> DeviceInfo:
+        """Build device registry information from the current data."""
+        return self._vm_device_info()
 
 
-class ProxmoxNodeDiskSensor(ProxmoxSensorBase):
-    """Sensor for Proxmox Node disk usage."""
+class ProxmoxNodeSensor(ProxmoxSensorBase):
+    """Sensor for one value of a Proxmox node, as given by its description."""
 
-    _attr_device_class = "data_size"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfInformation.BYTES
-    
     def __init__(
-        self, coordinator: DataUpdateCoordinator, node_id: str, entry_id: str
+        self,
+        coordinator: DataUpdateCoordinator,
+        node_id: str,
+        entry_id: str,
+        description: SensorDescription,
     ) -> None:
         """Initialize the sensor."""
-        # First set up the coordinator and basic attributes before anything else
-        self.coordinator = coordinator
         self._node_id = node_id
         self._entry_id = entry_id
+        self._description = description
+        self._device_identifiers = {(DOMAIN, f"node_{node_id}")}
+        self._fallback_name = f"Node {node_id}"
         
         # Set name based on node_id initially, then get Node data
-        unique_id = f"{DOMAIN}_{entry_id}_node_{node_id}_disk"
-        name = f"Node {node_id} Disk"
+        unique_id = f"{DOMAIN}_{entry_id}_node_{node_id}_{description.key}"
+        name = f"Node {node_id} {description.name}"
         
-        # Initialize parent classes
-        # Explicitly initialize coordinator to prevent attribute error
-        CoordinatorEntity.__init__(self, coordinator)
-        SensorEntity.__init__(self)
+        super().__init__(coordinator, unique_id, name)
+        self._attr_device_class = description.device_class
+        self._attr_state_class = description.state_class
+        self._attr_native_unit_of_measurement = description.unit
         
-        # Only now get node data after coordinator is available
+        # Get node data now that the coordinator is set
         self._node_data = self._get_node_data()
         
         # Update name if we have node data
         if self._node_data and self._node_data.get("name"):
-            self._attr_name = f"{self._node_data['name']} Disk"
-        else:
-            self._attr_name = name
-            
-        self._attr_unique_id = unique_id
+            self._attr_name = f"{self._node_data['name']} {description.name}"
+        
         self._update_state()
     
     @callback
@@ -698,55 +384,48 @@ class ProxmoxNodeDiskSensor(ProxmoxSensorBase):
         """Handle updated data from the coordinator."""
         self._node_data = self._get_node_data()
         self._update_state()
-        self.async_write_ha_state()
+        self._invalidate_cache()
+        self._async_write_if_changed()
 
     def _get_node_data(self) -> Optional[Dict[str, Any]]:
         """Get current node data from coordinator."""
-        for node in self.coordinator.data.get("nodes", []):
-            if node["id"] == self._node_id:
-                return node
-        return None
+        return self.coordinator.data["nodes_by_id"].get(self._node_id)
 
     def _update_state(self) -> None:
         """Update the state from the data."""
-        if not self._node_data or not self._node_data.get("disk"):
+        if not self._node_data:
             self._available = False
             return
         
-        disk_data = self._node_data["disk"]
-        self._state = disk_data.get("used", 0)
-        self._available = True
+        self._state = self._description.value(self._node_data)
+        self._available = self._state is not None
 
     @property
-    def native_value(self) -> Optional[int]:
+    def native_value(self) -> Optional[Union[float, int]]:
         """Return the state of the sensor."""
         if not self._available:
             return None
         return self._state
 
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return extra state attributes."""
+    def _build_attributes(self) -> Dict[str, Any]:
+        """Build extra state attributes from the current data."""
         attrs = {
             "device_type": CATEGORY_NODE,
             "node_id": self._node_id,
         }
-        
-        if self._node_data and self._node_data.get("disk"):
-            attrs["total_space"] = self._node_data["disk"].get("total", 0)
-            if self._state is not None and self._node_data["disk"].get("total", 0) > 0:
-                attrs["disk_percent"] = round(
-                    self._state / self._node_data["disk"].get("total", 1) * 100, 2
-                )
-        
+        if self._node_data:
+            attrs.update(self._description.attributes(self._node_data))
         return attrs
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device registry information."""
+    def _build_device_info(self) -> DeviceInfo:
+        """Build device registry information from the current data."""
         return DeviceInfo(
-            identifiers={(DOMAIN, f"node_{self._node_id}")},
-            name=self._node_data.get("name", f"Node {self._node_id}") if self._node_data else f"Node {self._node_id}",
+            identifiers=self._device_identifiers,
+            name=(
+                self._node_data.get("name", self._fallback_name)
+                if self._node_data
+                else self._fallback_name
+            ),
             manufacturer="Proxmox VE",
             model="Node",
         )
@@ -763,27 +442,24 @@ class ProxmoxStorageSensor(ProxmoxSensorBase):
         self, coordinator: DataUpdateCoordinator, storage_id: str, node_id: str, entry_id: str
     ) -> None:
         """Initialize the sensor."""
-        # First set up the coordinator and basic attributes before anything else
-        self.coordinator = coordinator
         self._storage_id = storage_id
         self._node_id = node_id
+        # Key of this storage's row in storages_by_key
+        self._key = (storage_id, node_id)
         self._entry_id = entry_id
+        self._device_identifiers = {(DOMAIN, f"storage_{storage_id}_{node_id}")}
+        self._fallback_name = f"Storage {storage_id}"
+        self._via_device = (DOMAIN, f"node_{node_id}")
         
         # Set name based on storage_id initially
         unique_id = f"{DOMAIN}_{entry_id}_storage_{storage_id}_{node_id}"
         name = f"Storage {storage_id} ({node_id})"
         
-        # Initialize parent classes
-        # Explicitly initialize coordinator to prevent attribute error
-        CoordinatorEntity.__init__(self, coordinator)
-        SensorEntity.__init__(self)
+        super().__init__(coordinator, unique_id, name)
         
-        # Only now get storage data after coordinator is available
+        # Get storage data now that the coordinator is set
         self._storage_data = self._get_storage_data()
         
-        # Set attributes
-        self._attr_name = name
-        self._attr_unique_id = unique_id
         self._update_state()
     
     @callback
@@ -791,23 +467,21 @@ class ProxmoxStorageSensor(ProxmoxSensorBase):
         """Handle updated data from the coordinator."""
         self._storage_data = self._get_storage_data()
         self._update_state()
-        self.async_write_ha_state()
+        self._invalidate_cache()
+        self._async_write_if_changed()
 
     def _get_storage_data(self) -> Optional[Dict[str, Any]]:
         """Get current storage data from coordinator."""
-        for storage in self.coordinator.data.get("storages", []):
-            if storage["id"] == self._storage_id and storage["node"] == self._node_id:
-                return storage
-        return None
+        return self.coordinator.data["storages_by_key"].get(self._key)
 
     def _update_state(self) -> None:
         """Update the state from the data."""
-        if not self._storage_data or not self._storage_data.get("disk"):
+        disk = (self._storage_data or {}).get("disk")
+        if not disk:
             self._available = False
             return
         
-        disk_data = self._storage_data["disk"]
-        self._state = disk_data.get("used", 0)
+        self._state = disk.get("used", 0)
         self._available = True
 
     @property
@@ -822,9 +496,8 @@ class ProxmoxStorageSensor(ProxmoxSensorBase):
         """Return the icon of the sensor."""
         return "mdi:harddisk"
 
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return extra state attributes."""
+    def _build_attributes(self) -> Dict[str, Any]:
+        """Build extra state attributes from the current data."""
         attrs = {
             "device_type": CATEGORY_STORAGE,
             "storage_id": self._storage_id,
@@ -835,22 +508,21 @@ class ProxmoxStorageSensor(ProxmoxSensorBase):
             attrs["type"] = self._storage_data.get("type", "unknown")
             attrs["status"] = self._storage_data.get("status", "unknown")
             
-            if self._storage_data.get("disk"):
-                attrs["total_space"] = self._storage_data["disk"].get("total", 0)
-                if self._state is not None and self._storage_data["disk"].get("total", 0) > 0:
-                    attrs["disk_percent"] = round(
-                        self._state / self._storage_data["disk"].get("total", 1) * 100, 2
-                    )
+            disk = self._storage_data.get("disk")
+            if disk:
+                total = disk.get("total", 0)
+                attrs["total_space"] = total
+                if "percent" in disk:
+                    attrs["disk_percent"] = disk["percent"]
         
         return attrs
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device registry information."""
+    def _build_device_info(self) -> DeviceInfo:
+        """Build device registry information from the current data."""
         return DeviceInfo(
-            identifiers={(DOMAIN, f"storage_{self._storage_id}_{self._node_id}")},
-            name=f"Storage {self._storage_id}",
+            identifiers=self._device_identifiers,
+            name=self._fallback_name,
             manufacturer="Proxmox VE",
             model=self._storage_data.get("type", "Storage") if self._storage_data else "Storage",
-            via_device=(DOMAIN, f"node_{self._node_id}"),
+            via_device=self._via_device,
         )